@@ -18,6 +18,7 @@ Portability Test:
 from __future__ import annotations
 
 import warnings
+from functools import cached_property
 from typing import Any
 
 from pydantic import Field, model_validator, AliasChoices
@@ -215,12 +216,17 @@ class AgentBlueprint(ImmutableRecord):
 
     # ── Derived Properties ────────────────────────────────────────────────
 
-    @property
+    # Blueprints are frozen, so these derived views are invariant for the
+    # lifetime of the instance. cached_property computes each list once on
+    # first access (storing it in the instance __dict__, which frozen only
+    # guards for declared fields) instead of re-walking self.tools and
+    # allocating a fresh list every time the Kernel consults them.
+    @cached_property
     def all_active_tools(self) -> list[str]:
         """Tool names available to the Kernel (Lifecycle + LLM). Used for validation."""
         return [t.name for t in self.tools if t.enabled]
 
-    @property
+    @cached_property
     def llm_tools(self) -> list[str]:
         """Tool names visible to the LLM. Only enabled AND exposed tools."""
         return [t.name for t in self.tools if t.enabled and t.exposed]
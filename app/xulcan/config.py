@@ -5,20 +5,24 @@ environment variables and/or a `.env` file. Provide type validation, default val
 and dynamic construction of sensitive connection strings (DSNs).
 """
 
-from functools import lru_cache
-from typing import Literal, Optional
+import os
+from functools import cached_property
+from typing import Any, Literal, Optional
 
 from pydantic import (
-    PostgresDsn,
-    RedisDsn,
     SecretStr,
     ValidationInfo,
-    computed_field,
     field_validator,
     model_validator
 )
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Native Docker-secrets directory: pydantic-settings reads a file named after
+# the field (e.g. /run/secrets/POSTGRES_PASSWORD) once at construction, in
+# pydantic-core. Only enabled when the directory actually exists so local
+# development does not emit "directory does not exist" warnings.
+_SECRETS_DIR = os.environ.get("XULCAN_SECRETS_DIR", "/run/secrets")
+
 
 class Settings(BaseSettings):
     """Application-wide configuration settings.
@@ -45,11 +49,18 @@ class Settings(BaseSettings):
         ANTHROPIC_API_KEY: API key for Anthropic services.
     """
 
+    # The legacy *_FILE fields remain as an explicit override for secrets
+    # stored outside the standard secrets_dir.
+    # frozen=True skips per-write validation in __setattr__ and guarantees
+    # the singleton is never mutated after construction; `cached_property`
+    # still works because it writes to the instance __dict__ directly.
     model_config = SettingsConfigDict(
-        env_file=".env", 
-        env_file_encoding="utf-8", 
+        env_file=".env",
+        env_file_encoding="utf-8",
         case_sensitive=True,
-        extra="ignore"
+        extra="ignore",
+        frozen=True,
+        secrets_dir=_SECRETS_DIR if os.path.isdir(_SECRETS_DIR) else None
     )
 
     # ==========================================================================
@@ -111,6 +122,25 @@ class Settings(BaseSettings):
     GEMINI_API_KEY: Optional[SecretStr] = None
     ANTHROPIC_API_KEY: Optional[SecretStr] = None
 
+    @classmethod
+    def from_env(cls, **overrides: Any) -> 'Settings':
+        """Construct settings from explicit overrides, skipping the `.env` scan.
+
+        `Settings()` parses the `.env` file via python-dotenv on every
+        instantiation. Production builds the singleton once, but test suites
+        that re-instantiate with `monkeypatch`ed environments pay that file
+        parse per construction. This constructor passes `_env_file=None` so
+        only `os.environ` and the given keyword overrides are consulted.
+
+        Args:
+            **overrides: Explicit field values taking precedence over the
+                environment.
+
+        Returns:
+            A Settings instance built without touching the `.env` file.
+        """
+        return cls(_env_file=None, **overrides)
+
     @field_validator("SECRET_KEY")
     @classmethod
     def validate_secret_key(cls, v: SecretStr, info: ValidationInfo) -> SecretStr:
@@ -134,33 +164,65 @@ class Settings(BaseSettings):
                 )
         return v
 
-    @computed_field(return_type=PostgresDsn)
-    @property
-    def DATABASE_URL(self) -> str:
-        """Construct the PostgreSQL connection DSN dynamically.
+    @model_validator(mode='before')
+    @classmethod
+    def resolve_password_files(cls, data: Any) -> Any:
+        """Resolve Docker-secret password files once at construction time.
 
         Password resolution priority:
-            1. POSTGRES_PASSWORD_FILE (Docker Secrets)
-            2. POSTGRES_PASSWORD (environment variable)
-            3. No password (trust authentication)
+            1. *_PASSWORD_FILE (Docker Secrets)
+            2. *_PASSWORD (environment variable)
+            3. No password
+
+        Runs in `before` mode so it operates on the raw source data: the
+        model itself is frozen, and reading the files here means DSN
+        properties are pure in-memory string formatting afterwards — no
+        syscalls on reconnect loops.
+
+        Args:
+            data: Raw field values gathered from the settings sources.
 
         Returns:
-            A fully-qualified PostgreSQL connection string using asyncpg driver.
+            The field values with resolved passwords.
 
         Raises:
-            ValueError: If POSTGRES_PASSWORD_FILE is defined but the file is missing.
+            ValueError: If a password file is defined but missing.
         """
-        password = ""
+        if not isinstance(data, dict):
+            return data
 
-        if self.POSTGRES_PASSWORD_FILE:
+        if data.get("POSTGRES_PASSWORD_FILE"):
             try:
-                with open(self.POSTGRES_PASSWORD_FILE, "r") as f:
-                    password = f.read().strip()
+                with open(data["POSTGRES_PASSWORD_FILE"], "r") as f:
+                    data["POSTGRES_PASSWORD"] = SecretStr(f.read().strip())
             except FileNotFoundError:
                 raise ValueError(
-                    f"CRITICAL: Database password file defined at '{self.POSTGRES_PASSWORD_FILE}' but not found."
+                    f"CRITICAL: Database password file defined at '{data['POSTGRES_PASSWORD_FILE']}' but not found."
                 )
-        elif self.POSTGRES_PASSWORD:
+
+        if data.get("REDIS_PASSWORD_FILE"):
+            try:
+                with open(data["REDIS_PASSWORD_FILE"], "r") as f:
+                    data["REDIS_PASSWORD"] = SecretStr(f.read().strip())
+            except FileNotFoundError:
+                raise ValueError(
+                    f"CRITICAL: Redis password file defined at '{data['REDIS_PASSWORD_FILE']}' but not found."
+                )
+
+        return data
+
+    @cached_property
+    def DATABASE_URL(self) -> str:
+        """Construct the PostgreSQL connection DSN from resolved credentials.
+
+        The password is resolved once at construction time (see
+        resolve_password_files), so this is pure string formatting.
+
+        Returns:
+            A fully-qualified PostgreSQL connection string using asyncpg driver.
+        """
+        password = ""
+        if self.POSTGRES_PASSWORD:
             password = self.POSTGRES_PASSWORD.get_secret_value()
 
         # Conditionally append password to avoid malformed "user:@host" syntax.
@@ -173,33 +235,18 @@ class Settings(BaseSettings):
             f"{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
         )
 
-    @computed_field(return_type=RedisDsn)
-    @property
+    @cached_property
     def REDIS_URL(self) -> str:
-        """Construct the Redis connection DSN dynamically.
+        """Construct the Redis connection DSN from resolved credentials.
 
-        Password resolution priority:
-            1. REDIS_PASSWORD_FILE (Docker Secrets)
-            2. REDIS_PASSWORD (environment variable)
-            3. No password
+        The password is resolved once at construction time (see
+        resolve_password_files), so this is pure string formatting.
 
         Returns:
             A fully-qualified Redis connection string.
-
-        Raises:
-            ValueError: If REDIS_PASSWORD_FILE is defined but the file is missing.
         """
         password = ""
-
-        if self.REDIS_PASSWORD_FILE:
-            try:
-                with open(self.REDIS_PASSWORD_FILE, "r") as f:
-                    password = f.read().strip()
-            except FileNotFoundError:
-                raise ValueError(
-                    f"CRITICAL: Redis password file defined at '{self.REDIS_PASSWORD_FILE}' but not found."
-                )
-        elif self.REDIS_PASSWORD:
+        if self.REDIS_PASSWORD:
             password = self.REDIS_PASSWORD.get_secret_value()
 
         # Redis URI syntax for password-only auth: "redis://:password@host:port/db"
@@ -208,42 +255,30 @@ class Settings(BaseSettings):
             auth_string = f":{password}@"
 
         return f"redis://{auth_string}{self.REDIS_HOST}:{self.REDIS_PORT}/0"
-    
-    @model_validator(mode='after')
-    def load_api_keys_from_secrets(self) -> 'Settings':
-        # --- Lógica para Gemini ---
-        if self.GEMINI_API_KEY_FILE:
-            try:
-                with open(self.GEMINI_API_KEY_FILE, "r") as f:
-                    self.GEMINI_API_KEY = SecretStr(f.read().strip())
-            except FileNotFoundError:
-                pass # O maneja el error según prefieras
 
-        # --- Lógica para Groq (AÑADE ESTO) ---
-        if self.GROQ_API_KEY_FILE:
-            try:
-                with open(self.GROQ_API_KEY_FILE, "r") as f:
-                    # Sobrescribimos la variable GROQ_API_KEY con el contenido del archivo
-                    self.GROQ_API_KEY = SecretStr(f.read().strip())
-            except FileNotFoundError:
-                pass
-
-        if self.SAMBANOVA_API_KEY_FILE:
-            try:
-                with open(self.SAMBANOVA_API_KEY_FILE, "r") as f:
-                    # Sobrescribimos la variable GROQ_API_KEY con el contenido del archivo
-                    self.SAMBANOVA_API_KEY = SecretStr(f.read().strip())
-            except FileNotFoundError:
-                pass
+    @model_validator(mode='before')
+    @classmethod
+    def load_api_keys_from_secrets(cls, data: Any) -> Any:
+        if not isinstance(data, dict):
+            return data
+
+        # Pares (campo destino, campo *_FILE); los archivos faltantes se
+        # ignoran en silencio — las claves de API son opcionales.
+        key_files = (
+            ("GEMINI_API_KEY", "GEMINI_API_KEY_FILE"),
+            ("GROQ_API_KEY", "GROQ_API_KEY_FILE"),
+            ("SAMBANOVA_API_KEY", "SAMBANOVA_API_KEY_FILE"),
+            ("GITHUB_TOKEN", "GITHUB_TOKEN_FILE"),
+        )
+        for key_field, file_field in key_files:
+            if data.get(file_field):
+                try:
+                    with open(data[file_field], "r") as f:
+                        data[key_field] = SecretStr(f.read().strip())
+                except FileNotFoundError:
+                    pass
 
-        if self.GITHUB_TOKEN_FILE:
-            try:
-                with open(self.GITHUB_TOKEN_FILE, "r") as f:
-                    self.GITHUB_TOKEN = SecretStr(f.read().strip())
-            except FileNotFoundError:
-                pass
-        
-        return self
+        return data
 
 
 # ==============================================================================
@@ -251,11 +286,18 @@ class Settings(BaseSettings):
 # ==============================================================================
 
 
-@lru_cache()
+# Configuration never varies at runtime, so the singleton is built once at
+# import time. A plain module attribute beats `lru_cache` here: no wrapper
+# call, no empty-args-tuple hash, no cache-dict lookup per DI resolution.
+settings = Settings()
+
+
 def get_settings() -> Settings:
-    """Return a cached singleton instance of the application settings.
+    """Return the singleton instance of the application settings.
 
     Use as a FastAPI dependency to inject configuration into route handlers.
+    Kept as a thin shim over the module-level ``settings`` singleton so it
+    remains overridable via ``app.dependency_overrides`` in tests.
 
     Returns:
         The singleton Settings instance.
@@ -264,4 +306,4 @@ def get_settings() -> Settings:
         >>> def get_db(settings: Settings = Depends(get_settings)):
         ...     pass
     """
-    return Settings()
\ No newline at end of file
+    return settings
\ No newline at end of file
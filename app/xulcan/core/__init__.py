@@ -2,8 +2,11 @@
 
 from .primitives import (
     ImmutableRecord,
+    CanonicalRecord,
     MachineID,
+    UniqueID,
     DisplayName,
+    HumanLabel,
     SemanticText,
     ExternalID,
     FinitePositiveFloat,
@@ -12,17 +15,30 @@ from .primitives import (
     ContextKey,
     SafeURL,
     Base64Data,
-    MimeType
+    MimeType,
+    MAX_IDENTIFIER_LENGTH,
+    MAX_LABEL_LENGTH,
+    MAX_SEMANTIC_TEXT_LENGTH,
+    MAX_EXTERNAL_ID_LENGTH
 )
 
 from .economics import (
-    UsageStats
+    UsageStats,
+    UsageAccumulator,
+    BudgetConfig,
+    BudgetStrategy,
+    parse_usage_json,
+    parse_usage_list_json,
+    sum_usage
 )
 
 __all__ =[
     "ImmutableRecord",
+    "CanonicalRecord",
     "MachineID",
+    "UniqueID",
     "DisplayName",
+    "HumanLabel",
     "SemanticText",
     "ExternalID",
     "FinitePositiveFloat",
@@ -32,5 +48,15 @@ __all__ =[
     "SafeURL",
     "Base64Data",
     "MimeType",
-    "UsageStats"
-]
\ No newline at end of file
+    "MAX_IDENTIFIER_LENGTH",
+    "MAX_LABEL_LENGTH",
+    "MAX_SEMANTIC_TEXT_LENGTH",
+    "MAX_EXTERNAL_ID_LENGTH",
+    "UsageStats",
+    "UsageAccumulator",
+    "BudgetConfig",
+    "BudgetStrategy",
+    "parse_usage_json",
+    "parse_usage_list_json",
+    "sum_usage"
+]
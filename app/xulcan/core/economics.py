@@ -4,19 +4,32 @@ Defines the economic primitives for resource accounting in Xulcan.
 This module models the consumption of resources as conserved physical
 quantities — Matter (tokens) and Time (latency).
 
-Strictly contains: UsageStats.
+Strictly contains: UsageStats and the declarative BudgetConfig.
 
 Budget enforcement policies (BursarHaltError, EnforcedBursarConfig, etc.)
 live in xulcan/governance/ — they are policy concerns, not physics.
+BudgetConfig only *declares* limits; it never enforces them.
 """
 
 from __future__ import annotations
 
+import math
+import sys
 import warnings
-from pydantic import Field, model_validator
+from dataclasses import dataclass
+from enum import Enum
+from functools import cached_property
+from typing import Iterable, Literal, Optional
+
+from pydantic import Field, TypeAdapter, model_validator
 
 from .primitives import ImmutableRecord, FinitePositiveFloat
 
+# Bound once at import: the consistency validator runs on every UsageStats
+# construction, and a plain global read is cheaper than the module
+# attribute lookup warnings.warn would pay per call.
+_warn = warnings.warn
+
 
 # =============================================================================
 # TOKEN USAGE TRACKING
@@ -101,21 +114,70 @@ class UsageStats(ImmutableRecord):
         description="Wall-clock execution time in milliseconds."
     )
 
+    def __hash__(self) -> int:
+        """Returns a hash memoized on first use.
+
+        The record is frozen, so the hash is constant; caching it makes
+        repeated dict/set membership checks in telemetry deduplication a
+        single dict load instead of a six-field tuple hash. The memo lives
+        in the instance __dict__ (like cached_property) rather than a
+        PrivateAttr: pydantic's __eq__ compares __pydantic_private__, so a
+        private-attr memo would make two equal records unequal once only
+        one of them had been hashed, while its fieldwise fallback ignores
+        non-field __dict__ entries.
+
+        Returns:
+            The hash of the field tuple.
+        """
+        cached = self.__dict__.get("_cached_hash")
+        if cached is None:
+            cached = hash((
+                self.input_tokens,
+                self.output_tokens,
+                self.total_tokens,
+                self.cache_read_input_tokens,
+                self.cache_creation_input_tokens,
+                self.latency_ms,
+            ))
+            # Direct __dict__ write bypasses the frozen __setattr__ guard,
+            # which only protects declared fields.
+            self.__dict__["_cached_hash"] = cached
+        return cached
+
     @classmethod
     def zero(cls) -> UsageStats:
-        """Initializes an empty usage record.
+        """Returns the canonical empty usage record.
+
+        The instance is a module-level singleton: it is frozen and all
+        fields are zero, so every accumulator seed (the common
+        ``sum(stats, UsageStats.zero())`` pattern) can share one object
+        instead of allocating an identical one per call.
 
         Returns:
-            UsageStats: A new instance with all counters set to zero.
+            UsageStats: The shared all-zero instance.
         """
-        return cls(
-            input_tokens=0,
-            output_tokens=0,
-            total_tokens=0,
-            cache_read_input_tokens=0,
-            cache_creation_input_tokens=0,
-            latency_ms=0.0
-        )
+        return _ZERO_USAGE
+
+    @classmethod
+    def from_trusted(cls, **kwargs: object) -> UsageStats:
+        """Builds an instance from pre-validated data, skipping validation.
+
+        Intended for provider adapters and other internal callers that
+        assemble stats from values they have already checked: it delegates
+        to ``model_construct``, bypassing field constraints and the
+        model validators entirely.
+
+        Warning:
+            Never feed this external input — use ``model_validate`` (or the
+            regular constructor) for anything crossing a trust boundary.
+
+        Args:
+            **kwargs: Field values, as accepted by the regular constructor.
+
+        Returns:
+            UsageStats: A new instance built without validation.
+        """
+        return cls.model_construct(**kwargs)
 
     def __add__(self, other: UsageStats) -> UsageStats:
         """Aggregates two UsageStats objects.
@@ -127,7 +189,9 @@ class UsageStats(ImmutableRecord):
             other: The UsageStats object to add to the current instance.
 
         Returns:
-            UsageStats: A new instance representing the sum of both records.
+            UsageStats: The sum of both records. When one operand is the
+            additive identity the other operand is returned as-is — safe to
+            alias because instances are frozen.
 
         Raises:
             TypeError: If the 'other' object is not an instance of UsageStats.
@@ -135,7 +199,19 @@ class UsageStats(ImmutableRecord):
         if not isinstance(other, UsageStats):
             return NotImplemented
 
-        return UsageStats(
+        # Accumulations typically seed from zero(); the identity check on
+        # the shared singleton (or any all-zero record) skips N-1 redundant
+        # constructions when reducing N stats.
+        if other is _ZERO_USAGE or other._is_additive_identity():
+            return self
+        if self is _ZERO_USAGE or self._is_additive_identity():
+            return other
+
+        # Both operands already passed validation, and the invariants are
+        # closed under addition (sums preserve the token equation, and
+        # cache_read <= input holds field-wise). model_construct skips the
+        # validator chain, keeping aggregation loops on the fast path.
+        return UsageStats.model_construct(
             input_tokens=self.input_tokens + other.input_tokens,
             output_tokens=self.output_tokens + other.output_tokens,
             total_tokens=self.total_tokens + other.total_tokens,
@@ -145,16 +221,24 @@ class UsageStats(ImmutableRecord):
         )
 
     @model_validator(mode='after')
-    def validate_token_math(self) -> UsageStats:
-        """Ensures the token counts are mathematically consistent.
-
-        Validates that total_tokens equals input_tokens + output_tokens.
+    def validate_consistency(self) -> UsageStats:
+        """Ensures the record is mathematically and physically consistent.
+
+        Validates that total_tokens equals input_tokens + output_tokens, that
+        cache read tokens do not exceed total input tokens, and warns if
+        tokens were processed with zero latency (unless the operation was a
+        full cache hit, which is the only case allowed to violate the
+        conservation of time principle). All checks live in one validator:
+        each model_validator costs a Python frame per construction, and
+        these are a handful of trivial comparisons over fields already in
+        registers.
 
         Returns:
             UsageStats: The validated instance.
 
         Raises:
             ValueError: If total_tokens does not equal input + output.
+            ValueError: If cache_read_input_tokens exceeds input_tokens.
         """
         calculated = self.input_tokens + self.output_tokens
         if self.total_tokens != calculated:
@@ -163,54 +247,45 @@ class UsageStats(ImmutableRecord):
                 f"input({self.input_tokens}) + output({self.output_tokens}) "
                 f"= {calculated}, but total_tokens={self.total_tokens}"
             )
-        return self
-
-    @model_validator(mode='after')
-    def validate_cache_consistency(self) -> UsageStats:
-        """Ensures cache read tokens do not exceed total input tokens.
 
-        Returns:
-            UsageStats: The validated instance.
-
-        Raises:
-            ValueError: If cache_read_input_tokens exceeds input_tokens.
-        """
         if self.cache_read_input_tokens > self.input_tokens:
             raise ValueError(
                 f"Cache read tokens ({self.cache_read_input_tokens}) cannot exceed "
                 f"total input tokens ({self.input_tokens})"
             )
+
+        if self.total_tokens != 0 and self.latency_ms == 0:
+            is_full_cache_hit = (
+                self.cache_read_input_tokens == self.input_tokens
+                and self.output_tokens == 0
+            )
+            if not is_full_cache_hit:
+                _warn(
+                    f"Physical inconsistency: processed {self.total_tokens} tokens "
+                    f"with 0.0ms latency. This violates conservation of time unless "
+                    f"the operation was 100% cached.",
+                    UserWarning,
+                    stacklevel=2
+                )
+
         return self
 
-    @model_validator(mode='after')
-    def validate_latency_plausibility(self) -> UsageStats:
-        """Validates physical plausibility of resource consumption.
+    def _is_additive_identity(self) -> bool:
+        """Checks whether adding this record to another is a no-op.
 
-        Warns if tokens were processed with zero latency, unless it was a
-        full cache hit. This enforces the conservation of time principle.
+        Stricter than ``is_empty``: the cache counters must also be zero,
+        since they contribute to sums independently of total_tokens.
 
         Returns:
-            UsageStats: The validated instance.
+            True if every field is zero.
         """
-        if self.total_tokens == 0:
-            return self
-
-        is_full_cache_hit = (
-            self.cache_read_input_tokens == self.input_tokens
-            and self.output_tokens == 0
+        return (
+            self.total_tokens == 0
+            and self.latency_ms == 0.0
+            and self.cache_read_input_tokens == 0
+            and self.cache_creation_input_tokens == 0
         )
 
-        if self.latency_ms == 0 and not is_full_cache_hit:
-            warnings.warn(
-                f"Physical inconsistency: processed {self.total_tokens} tokens "
-                f"with 0.0ms latency. This violates conservation of time unless "
-                f"the operation was 100% cached.",
-                UserWarning,
-                stacklevel=2
-            )
-
-        return self
-
     @property
     def is_empty(self) -> bool:
         """Checks if this usage record represents zero consumption.
@@ -220,10 +295,13 @@ class UsageStats(ImmutableRecord):
         """
         return self.total_tokens == 0 and self.latency_ms == 0.0
 
-    @property
+    @cached_property
     def cache_efficiency(self) -> float:
         """Calculates the percentage of input tokens served from cache.
 
+        Memoized on first access: the record is frozen, so the ratio is
+        constant over the instance lifetime.
+
         Returns:
             The ratio of cache_read_input_tokens to input_tokens,
             or 0.0 if input_tokens is zero.
@@ -232,11 +310,278 @@ class UsageStats(ImmutableRecord):
             return 0.0
         return self.cache_read_input_tokens / self.input_tokens
 
-    @property
+    @cached_property
     def total_cache_tokens(self) -> int:
         """Calculates total cache-related tokens (both read and creation).
 
+        Memoized on first access; see ``cache_efficiency``.
+
         Returns:
             The sum of cache_read_input_tokens and cache_creation_input_tokens.
         """
         return self.cache_read_input_tokens + self.cache_creation_input_tokens
+
+
+# Shared additive identity returned by UsageStats.zero(). Safe to alias
+# freely: the record is frozen, so no caller can distinguish the singleton
+# from a fresh all-zero instance except by identity.
+_ZERO_USAGE = UsageStats.model_construct(
+    input_tokens=0,
+    output_tokens=0,
+    total_tokens=0,
+    cache_read_input_tokens=0,
+    cache_creation_input_tokens=0,
+    latency_ms=0.0
+)
+
+
+# =============================================================================
+# JSON PARSING
+# =============================================================================
+
+# Precompiled adapters: building a TypeAdapter generates a pydantic-core
+# schema, so it must happen once at import, never per call. validate_json
+# parses and validates in a single Rust pass — prefer it over
+# model_validate(json.loads(...)) in adapter code.
+_USAGE_STATS_ADAPTER = TypeAdapter(UsageStats)
+_USAGE_STATS_LIST_ADAPTER = TypeAdapter(list[UsageStats])
+
+
+def parse_usage_json(data: bytes | str) -> UsageStats:
+    """Parses and validates a JSON-encoded usage record in one pass.
+
+    Args:
+        data: Raw JSON bytes or string for a single usage record.
+
+    Returns:
+        UsageStats: The validated record.
+
+    Raises:
+        pydantic.ValidationError: If the payload is malformed or violates
+            the usage invariants.
+    """
+    return _USAGE_STATS_ADAPTER.validate_json(data)
+
+
+def parse_usage_list_json(data: bytes | str) -> list[UsageStats]:
+    """Parses and validates a JSON array of usage records in one pass.
+
+    Args:
+        data: Raw JSON bytes or string for a list of usage records.
+
+    Returns:
+        list[UsageStats]: The validated records, in payload order.
+
+    Raises:
+        pydantic.ValidationError: If the payload is malformed or any entry
+            violates the usage invariants.
+    """
+    return _USAGE_STATS_LIST_ADAPTER.validate_json(data)
+
+
+# =============================================================================
+# BULK AGGREGATION
+# =============================================================================
+
+@dataclass(slots=True)
+class UsageAccumulator:
+    """Mutable accumulator for summing many UsageStats without allocation.
+
+    ``total += per_call_stats`` over frozen records allocates O(N)
+    intermediate instances. This sibling follows the string-builder idiom:
+    accumulate in-place on slotted fields, then snapshot to a single
+    immutable ``UsageStats`` at the end.
+
+    Latency is summed like tokens, matching ``UsageStats.__add__``'s
+    sequential-execution assumption.
+
+    Example:
+        >>> acc = UsageAccumulator()
+        >>> for stats in per_call_stats:
+        ...     acc.add(stats)
+        >>> total = acc.freeze()
+    """
+    input_tokens: int = 0
+    output_tokens: int = 0
+    total_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    latency_ms: float = 0.0
+
+    def add(self, stats: UsageStats) -> UsageAccumulator:
+        """Accumulates one usage record in-place.
+
+        Args:
+            stats: The validated record to fold into the running totals.
+
+        Returns:
+            UsageAccumulator: This accumulator, for chaining.
+        """
+        self.input_tokens += stats.input_tokens
+        self.output_tokens += stats.output_tokens
+        self.total_tokens += stats.total_tokens
+        self.cache_read_input_tokens += stats.cache_read_input_tokens
+        self.cache_creation_input_tokens += stats.cache_creation_input_tokens
+        self.latency_ms += stats.latency_ms
+        return self
+
+    def freeze(self) -> UsageStats:
+        """Snapshots the running totals as an immutable UsageStats.
+
+        The inputs were validated records and the invariants are closed
+        under addition, so the snapshot uses the trusted fast path.
+
+        Returns:
+            UsageStats: A frozen record of the accumulated totals.
+        """
+        return UsageStats.model_construct(
+            input_tokens=self.input_tokens,
+            output_tokens=self.output_tokens,
+            total_tokens=self.total_tokens,
+            cache_read_input_tokens=self.cache_read_input_tokens,
+            cache_creation_input_tokens=self.cache_creation_input_tokens,
+            latency_ms=self.latency_ms
+        )
+
+
+def sum_usage(stats: Iterable[UsageStats]) -> UsageStats:
+    """Sums many usage records in a single pass with one allocation.
+
+    The canonical entry point for bulk aggregation (billing rollups,
+    observability pipelines): ``sum(stats, UsageStats.zero())`` allocates
+    an intermediate record per step, while this folds everything through
+    one slotted accumulator and snapshots once.
+
+    Args:
+        stats: Validated usage records to aggregate.
+
+    Returns:
+        UsageStats: The frozen sum, or the zero singleton for an empty
+        iterable.
+    """
+    acc = UsageAccumulator()
+    for item in stats:
+        acc.add(item)
+    if (
+        acc.total_tokens == 0
+        and acc.latency_ms == 0.0
+        and acc.cache_read_input_tokens == 0
+        and acc.cache_creation_input_tokens == 0
+    ):
+        return _ZERO_USAGE
+    return acc.freeze()
+
+
+# =============================================================================
+# BUDGET DECLARATION
+# =============================================================================
+
+class BudgetStrategy(str, Enum):
+    """Declarative policy for how budget limits should be interpreted.
+
+    Values:
+        HARD_CAP: Crossing a limit must halt the run.
+        SOFT_NOTIFY: Crossing a limit only emits a warning; the run continues.
+    """
+    HARD_CAP = "hard_cap"
+    SOFT_NOTIFY = "soft_notify"
+
+
+# Field annotation for strategy values. Literal validation is a C-level
+# string comparison against two interned values, skipping Enum member
+# resolution per construction; pydantic normalizes enum input to the plain
+# string, so callers may pass either form. Keep in sync with BudgetStrategy.
+BudgetStrategyValue = Literal["hard_cap", "soft_notify"]
+
+
+class BudgetConfig(ImmutableRecord):
+    """Declares resource limits for a run without enforcing them.
+
+    This is pure declaration — the Bursar strategies in xulcan/governance/
+    are responsible for turning these limits into verdicts. Keeping the
+    declaration here lets blueprints and manifests share one canonical shape.
+
+    Attributes:
+        token_limit: Maximum total tokens for the run. None = unbounded.
+        time_limit_ms: Maximum cumulative latency in milliseconds. None = unbounded.
+        strategy: How crossing a limit should be interpreted (hard vs soft).
+
+    Raises:
+        ValueError: If strategy is HARD_CAP but no limit is defined
+                    (an unbounded hard cap is a contradiction in terms).
+        ValueError: If any defined limit is zero, negative, NaN, or Infinity.
+
+    Example:
+        >>> budget = BudgetConfig(token_limit=1000, strategy=BudgetStrategy.HARD_CAP)
+        >>> budget.is_unbounded
+        False
+    """
+    token_limit: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Maximum total tokens for the run. None = unbounded."
+    )
+
+    time_limit_ms: Optional[FinitePositiveFloat] = Field(
+        default=None,
+        description="Maximum cumulative latency in milliseconds. None = unbounded."
+    )
+
+    strategy: BudgetStrategyValue = Field(
+        description="How crossing a limit should be interpreted (hard vs soft)."
+    )
+
+    @model_validator(mode='after')
+    def validate_limits(self) -> BudgetConfig:
+        """Ensures the declared limits form a coherent policy.
+
+        Returns:
+            BudgetConfig: The validated instance.
+
+        Raises:
+            ValueError: If time_limit_ms is zero, or if the strategy is
+                        HARD_CAP with no limit defined at all.
+        """
+        if self.time_limit_ms is not None and self.time_limit_ms == 0.0:
+            raise ValueError("time_limit_ms must be strictly positive when defined.")
+
+        if self.strategy == BudgetStrategy.HARD_CAP and self.is_unbounded:
+            raise ValueError(
+                "Unbounded hard cap: strategy=HARD_CAP requires at least one "
+                "limit (token_limit or time_limit_ms). For advisory budgets "
+                "without limits, use SOFT_NOTIFY."
+            )
+        return self
+
+    @property
+    def is_unbounded(self) -> bool:
+        """Checks whether this budget declares no limits at all.
+
+        Returns:
+            True if both token_limit and time_limit_ms are None.
+        """
+        return self.token_limit is None and self.time_limit_ms is None
+
+    @cached_property
+    def effective_token_limit(self) -> int:
+        """Returns the token limit with None mapped to a maximal sentinel.
+
+        Enforcement loops that run per streamed chunk can compare
+        ``usage.total_tokens > budget.effective_token_limit`` without
+        branching on None; an unbounded budget never trips the comparison.
+
+        Returns:
+            token_limit, or ``sys.maxsize`` when unbounded.
+        """
+        return self.token_limit if self.token_limit is not None else sys.maxsize
+
+    @cached_property
+    def effective_time_limit_ms(self) -> float:
+        """Returns the time limit with None mapped to infinity.
+
+        See ``effective_token_limit`` for the branchless-check rationale.
+
+        Returns:
+            time_limit_ms, or ``math.inf`` when unbounded.
+        """
+        return self.time_limit_ms if self.time_limit_ms is not None else math.inf
@@ -19,13 +19,15 @@ semantic and security boundaries, preventing malformed, ambiguous,
 or adversarial data from entering the system.
 """
 
+from functools import lru_cache
 from typing import Annotated, Any
 from pydantic import BaseModel, ConfigDict, Field, AfterValidator
 import re
 import math
-import json
 import base64
+import orjson
 import binascii
+import sys
 
 
 # =============================================================================
@@ -47,8 +49,16 @@ MAX_EXTERNAL_ID_LENGTH = 256
 MIME_TYPE_REGEX = re.compile(r'^[a-z0-9\.\-\+]+/[a-z0-9\.\-\+]+(;.*)?$', re.IGNORECASE)
 """Regex for basic MIME type validation (type/subtype). Allows optional parameters."""
 
-ID_REGEX = re.compile(r'^[a-z0-9]([a-z0-9_\-]*[a-z0-9])?$')
-"""Regex pattern for validating machine identifiers."""
+ID_REGEX = re.compile(
+    r'^[a-z0-9]([a-z0-9_\-]*[a-z0-9])?'
+    r'(\.[a-z0-9]([a-z0-9_\-]*[a-z0-9])?)*$'
+)
+"""Regex pattern for validating machine identifiers.
+
+Identifiers are dot-separated namespace segments (e.g. 'chat.main');
+each segment is lowercase alphanumeric with hyphen/underscore separators
+that cannot lead or trail the segment.
+"""
 
 URL_REGEX = re.compile(
     r'^https?://'                                                    # Scheme
@@ -69,6 +79,12 @@ SEMVER_REGEX = re.compile(r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)(?:-[a-zA-Z
 CONTEXT_KEY_REGEX = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
 """Regex for validating context variable names (must be valid Python identifiers)."""
 
+BASE64_WHITESPACE_REGEX = re.compile(r'\s+')
+"""Regex matching whitespace runs stripped from Base64 payloads before decoding."""
+
+BASE64_ALPHABET_REGEX = re.compile(r'[A-Za-z0-9+/]*={0,2}')
+"""Regex for the standard Base64 alphabet with at most two padding characters."""
+
 MAX_NESTING_DEPTH = 20
 """Maximum allowed nesting depth for JSON-like structures to prevent stack overflow."""
 
@@ -110,9 +126,20 @@ class ImmutableRecord(BaseModel):
 # FLOAT VALIDATION HELPERS
 # =============================================================================
 
+# Bound once at import so the per-call lookups below are plain global reads
+# instead of a module attribute access (math.isnan -> dict lookup on math)
+# on every float field validation.
+_isnan = math.isnan
+_isfinite = math.isfinite
+
+
 def _validate_finite_float(value: float) -> float:
     """Validates that a float value is finite, non-negative, and not NaN.
 
+    The happy path pays a single isfinite() call; NaN is only distinguished
+    from Infinity on the failure path, where the cost of a second check is
+    irrelevant next to raising.
+
     Args:
         value: The float value to validate.
 
@@ -122,10 +149,9 @@ def _validate_finite_float(value: float) -> float:
     Raises:
         ValueError: If the value is NaN, Infinity, or negative.
     """
-    if math.isnan(value):
-        raise ValueError("Value cannot be NaN. Must be a valid number.")
-
-    if math.isinf(value):
+    if not _isfinite(value):
+        if _isnan(value):
+            raise ValueError("Value cannot be NaN. Must be a valid number.")
         raise ValueError("Value cannot be Infinity. Must be finite.")
 
     if value < 0.0:
@@ -149,11 +175,14 @@ FinitePositiveFloat = Annotated[
 # STRING NORMALIZATION HELPERS
 # =============================================================================
 
-def _validate_machine_identifier(value: str) -> str:
+def _check_machine_identifier(value: str) -> str:
     """Validates and normalizes a machine identifier string.
 
     Enforces that the string is not empty or whitespace-only after stripping,
-    and prevents DoS attacks by enforcing maximum length constraints.
+    and prevents DoS attacks by enforcing maximum length constraints. This is
+    the uncached core: use it directly for high-cardinality values (event
+    UUIDs) where every input is unique and memoization or interning would
+    only pollute the caches that the low-cardinality identifiers rely on.
 
     Args:
         value: The input string to validate.
@@ -168,7 +197,7 @@ def _validate_machine_identifier(value: str) -> str:
     cleaned_value = value.strip()
 
     if not cleaned_value:
-        raise ValueError("MachineID cannot be empty or whitespace-only.")
+        raise ValueError("MachineID cannot be empty or whitespace only.")
 
     if len(cleaned_value) > MAX_IDENTIFIER_LENGTH:
         raise ValueError(
@@ -185,6 +214,40 @@ def _validate_machine_identifier(value: str) -> str:
     return cleaned_value
 
 
+# Identifier and label values repeat heavily across requests (agent ids,
+# tool names, field labels), so the memoized result is usually a cache hit
+# that skips the strip/scan/regex work entirely. Both functions are pure
+# str -> str, and lru_cache does not cache raised ValueErrors, so invalid
+# inputs are still rejected on every call. Never route never-repeating
+# values (event ids) through here — each one is a guaranteed miss that
+# evicts a genuinely hot entry; use _check_machine_identifier instead.
+@lru_cache(maxsize=8192)
+def _validate_machine_identifier(value: str) -> str:
+    """Memoizing wrapper over _check_machine_identifier for repeating IDs.
+
+    Args:
+        value: The input string to validate.
+
+    Returns:
+        The stripped, interned identifier string.
+
+    Raises:
+        ValueError: If the identifier fails any _check_machine_identifier rule.
+    """
+    # Identifiers come from a small vocabulary (agent ids, tool names) and
+    # end up as dict keys and equality operands in dispatch tables; interning
+    # turns those downstream comparisons into pointer checks.
+    return sys.intern(_check_machine_identifier(value))
+
+
+# Deletion table for all ASCII control characters (0-31, including \n, \r
+# and \t). translate() runs the scan in C, so the clean common case pays a
+# single pass instead of two substring scans plus a per-character Python
+# comprehension; offending input is only classified on the failure path.
+_CONTROL_CHARS_TABLE = dict.fromkeys(range(32), None)
+
+
+@lru_cache(maxsize=8192)
 def _validate_display_name(value: str) -> str:
     """Validates and normalizes a human-readable UI label.
 
@@ -207,21 +270,19 @@ The stripped, single-line label.
     if not cleaned_value:
         raise ValueError("DisplayName cannot be empty or whitespace-only.")
 
-    if '\n' in cleaned_value or '\r' in cleaned_value:
-        raise ValueError("DisplayName must be a single line (no newlines).")
+    # One C-level sweep catches every ASCII control character (newlines,
+    # tabs, NULL, bells, ...); only a failing value is re-scanned to pick
+    # the newline-specific error over the generic one.
+    if len(cleaned_value.translate(_CONTROL_CHARS_TABLE)) != len(cleaned_value):
+        if '\n' in cleaned_value or '\r' in cleaned_value:
+            raise ValueError("DisplayName must be a single line (no newlines).")
+        raise ValueError("DisplayName contains non-printable characters.")
 
+    # Non-ASCII invisibles (zero-width spaces, Unicode line separators, DEL)
+    # are outside the table and still rejected here.
     if not cleaned_value.isprintable():
         raise ValueError("DisplayName contains non-printable characters.")
 
-    # Check for additional invisible control characters (ASCII 0-31 except space)
-    # This prevents tabs, vertical tabs, backspaces, etc.
-    control_chars = [c for c in cleaned_value if ord(c) < 32 and c not in ('\n', '\r')]
-    if control_chars:
-        raise ValueError(
-            f"DisplayName contains invisible control characters: "
-            f"{[hex(ord(c)) for c in control_chars]}"
-        )
-
     # Enforce stricter length limit for user-facing labels
     if len(cleaned_value) > MAX_LABEL_LENGTH:
         raise ValueError(
@@ -276,13 +337,13 @@ def _validate_base64_data(value: str) -> str:
         ValueError: If the string is empty, contains invalid characters, or is corrupted.
     """
     # Basic cleaning (ignore spaces/newlines that break strict decoders)
-    cleaned_value = re.sub(r'\s+', '', value)
+    cleaned_value = BASE64_WHITESPACE_REGEX.sub('', value)
 
     if not cleaned_value:
         raise ValueError("Base64Data cannot be empty.")
 
     # Verify valid characters (A-Z, a-z, 0-9, +, /, =)
-    if not re.fullmatch(r'[A-Za-z0-9+/]*={0,2}', cleaned_value):
+    if not BASE64_ALPHABET_REGEX.fullmatch(cleaned_value):
         raise ValueError("Invalid Base64 characters detected. Only A-Z, a-z, 0-9, +, / and = are allowed.")
 
     # Verify actual decoding (structural integrity)
@@ -295,15 +356,20 @@ def _validate_base64_data(value: str) -> str:
     return cleaned_value
 
 
-def _validate_semantic_text(value: str) -> str:
+def _validate_semantic_text(value: str, _max: int = MAX_SEMANTIC_TEXT_LENGTH) -> str:
     """Validates semantic text content to prevent DoS attacks.
 
     Enforces maximum length constraints to prevent memory exhaustion attacks
     from unbounded string payloads. Semantic text is typically used for prompts,
     code, or other content where whitespace preservation is critical.
 
+    The limit is bound as a default argument so the per-call check reads it
+    via LOAD_FAST instead of a module-global dict lookup; this validator runs
+    on every prompt/content field and its body is otherwise a single len().
+
     Args:
         value: The input string to validate.
+        _max: Maximum accepted length; bound once at definition time.
 
     Returns:
         The validated semantic text string.
@@ -311,9 +377,9 @@ def _validate_semantic_text(value: str) -> str:
     Raises:
         ValueError: If the string exceeds the maximum allowed length.
     """
-    if len(value) > MAX_SEMANTIC_TEXT_LENGTH:
+    if len(value) > _max:
         raise ValueError(
-            f"SemanticText exceeds maximum length of {MAX_SEMANTIC_TEXT_LENGTH} "
+            f"SemanticText exceeds maximum length of {_max} "
             f"characters (got {len(value)}). This limit prevents DoS attacks from "
             f"unbounded string payloads."
         )
@@ -365,16 +431,22 @@ def _validate_mime_type(value: str) -> str:
     Raises:
         ValueError: If the MIME type is empty or has invalid format.
     """
-    # Preserve original case here; callers may enforce exact-case policies.
-    cleaned_value = value.strip().lower()
-
-    if not cleaned_value:
+    if not value:
         raise ValueError("MimeType cannot be empty.")
 
-    if not MIME_TYPE_REGEX.match(cleaned_value):
+    if not MIME_TYPE_REGEX.match(value):
         raise ValueError(f"Invalid MIME type format: '{value}'. Expected 'type/subtype'.")
 
-    return cleaned_value
+    # Normalize only type/subtype (case-insensitive per RFC 2045); parameters
+    # are preserved verbatim and must be printable lowercase to avoid ambiguity.
+    head, sep, params = value.partition(';')
+    if params and (not params.isprintable() or params != params.lower()):
+        raise ValueError(
+            f"Invalid MIME type parameters in '{value}': "
+            f"parameters must be printable and lowercase."
+        )
+
+    return head.lower() + sep + params
 
 
 def _validate_semver(value: str) -> str:
@@ -420,9 +492,38 @@ def _validate_context_key(value: str) -> str:
     return cleaned_value
 
 
+# Key types that json.dumps accepts (and coerces to strings) by default.
+_JSON_KEY_TYPES = (str, int, float, bool, type(None))
+
+# Stack sentinel marking the point where a container leaves the current
+# DFS path (enables json.dumps-style circular reference detection).
+_PATH_POP = object()
+
+# FIFO cache of serialized forms already proven valid. Agent loops rebuild
+# identical FunctionDef.parameters schemas (and repeat common ToolCall
+# arguments) thousands of times per session. orjson natively serializes
+# some non-JSON types (datetime, UUID, dataclasses), so a key match alone
+# is not proof of validity: hits are only trusted after round-tripping the
+# key and comparing it to the payload, which fails for exactly those
+# types. A plain dict gives insertion-ordered O(1) eviction.
+_PAYLOAD_CACHE_MAX = 1024
+_validated_payload_keys: dict[bytes, None] = {}
+_PAYLOAD_KEY_OPTS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+
 def _validate_json_dict(value: dict[str, Any]) -> dict[str, Any]:
     """Validates that a dictionary is strictly JSON-serializable and depth-bounded.
 
+    Performs a single iterative walk that checks serializability, circular
+    references, and nesting depth at once. The previous implementation
+    traversed the payload twice — a throw-away ``json.dumps`` probe followed
+    by a recursive Python depth check — paying one full serialization (and
+    its discarded string) per ToolCall/FunctionDef construction. The explicit
+    stack also keeps memory bounded by the payload size rather than the
+    interpreter call stack. Payloads whose canonical serialization has
+    already been proven valid skip the walk after a round-trip equality
+    check on the cache key (see _validated_payload_keys).
+
     Args:
         value: The dictionary to validate.
 
@@ -431,32 +532,87 @@ def _validate_json_dict(value: dict[str, Any]) -> dict[str, Any]:
 
     Raises:
         ValueError: If the value is not a dictionary, is not JSON-serializable,
-                    or exceeds the maximum nesting depth.
+                    contains circular references, or exceeds the maximum
+                    nesting depth.
     """
     if not isinstance(value, dict):
         raise ValueError("Payload must be a dictionary.")
 
-    # 1. Validate physical serialization (Prevents DB objects, lambdas, non-serializable types)
+    # Fast path: a payload whose canonical serialization was already proven
+    # valid needs no re-walk. orjson renders the key in C; payloads it cannot
+    # serialize (or that cycle) simply fall through to the full walk. A key
+    # hit is only trusted if the key deserializes back to an equal payload —
+    # orjson silently renders datetime/UUID/dataclass values as JSON, and
+    # those must still reach the walk to be rejected.
     try:
-        json.dumps(value)
-    except (TypeError, ValueError) as e:
-        raise ValueError(f"Payload must be strictly JSON-serializable: {e}")
-
-    # 2. Validate recursive depth (Prevents JSON bombs / YAML aliases)
-    def _check_depth(data: Any, current_depth: int = 0) -> None:
-        if current_depth > MAX_NESTING_DEPTH:
+        cache_key = orjson.dumps(value, option=_PAYLOAD_KEY_OPTS)
+    except (TypeError, ValueError):
+        cache_key = None
+    if (
+        cache_key is not None
+        and cache_key in _validated_payload_keys
+        and orjson.loads(cache_key) == value
+    ):
+        return value
+
+    stack: list[tuple[Any, int]] = [(value, 0)]
+    on_path: set[int] = set()
+    while stack:
+        node, depth = stack.pop()
+        if node is _PATH_POP:
+            # depth carries the container id pushed below.
+            on_path.discard(depth)
+            continue
+
+        if depth > MAX_NESTING_DEPTH:
             raise ValueError(
                 f"Data structure exceeds maximum nesting depth of {MAX_NESTING_DEPTH}."
             )
 
-        if isinstance(data, dict):
-            for val in data.values():
-                _check_depth(val, current_depth + 1)
-        elif isinstance(data, list):
-            for item in data:
-                _check_depth(item, current_depth + 1)
+        if isinstance(node, dict):
+            node_id = id(node)
+            if node_id in on_path:
+                raise ValueError(
+                    "Payload must be strictly JSON-serializable: "
+                    "Circular reference detected"
+                )
+            on_path.add(node_id)
+            stack.append((_PATH_POP, node_id))
+            for key in node:
+                if not isinstance(key, _JSON_KEY_TYPES):
+                    raise ValueError(
+                        "Payload must be strictly JSON-serializable: "
+                        f"keys must be str, int, float, bool or None, "
+                        f"not {type(key).__name__}"
+                    )
+            child_depth = depth + 1
+            for val in node.values():
+                stack.append((val, child_depth))
+        elif isinstance(node, (list, tuple)):
+            node_id = id(node)
+            if node_id in on_path:
+                raise ValueError(
+                    "Payload must be strictly JSON-serializable: "
+                    "Circular reference detected"
+                )
+            on_path.add(node_id)
+            stack.append((_PATH_POP, node_id))
+            child_depth = depth + 1
+            for item in node:
+                stack.append((item, child_depth))
+        elif node is not None and not isinstance(node, (str, int, float)):
+            # bool is an int subclass; str/int/float subclasses (e.g. str
+            # Enums) serialize like their base type, matching json.dumps.
+            raise ValueError(
+                "Payload must be strictly JSON-serializable: "
+                f"Object of type {type(node).__name__} is not JSON serializable"
+            )
+
+    if cache_key is not None:
+        if len(_validated_payload_keys) >= _PAYLOAD_CACHE_MAX:
+            del _validated_payload_keys[next(iter(_validated_payload_keys))]
+        _validated_payload_keys[cache_key] = None
 
-    _check_depth(value)
     return value
 
 
@@ -470,6 +626,16 @@ MachineID = Annotated[
     Field(description="Machine identifier (stripped, non-empty, max 128 chars)")
 ]
 
+# Same rules as MachineID, but validated through the uncached core. Use this
+# for high-cardinality fields (fresh event UUIDs): every such value would be
+# a guaranteed lru miss that evicts a genuinely repeating identifier and
+# interns a string used exactly once.
+UniqueID = Annotated[
+    str,
+    AfterValidator(_check_machine_identifier),
+    Field(description="High-cardinality machine identifier (MachineID rules, no memoization)")
+]
+
 SafeURL = Annotated[
     str,
     AfterValidator(_validate_safe_url),
@@ -523,3 +689,18 @@ JsonDict = Annotated[
     AfterValidator(_validate_json_dict),
     Field(description="A strictly JSON-serializable dictionary with bounded nesting depth.")
 ]
+
+
+# =============================================================================
+# CANONICAL ALIASES
+# =============================================================================
+# The canonical vocabulary ("CanonicalRecord", "HumanLabel") is the preferred
+# public surface; the older names remain valid for existing call sites.
+
+CanonicalRecord = ImmutableRecord
+"""Canonical name for the frozen, strict base record."""
+
+HumanLabel = DisplayName
+"""Canonical name for the single-line, human-readable label type."""
+
+_validate_human_label = _validate_display_name
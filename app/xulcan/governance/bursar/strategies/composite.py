@@ -0,0 +1,60 @@
+"""Composite Bursar — combina App + Agent Bursar con semántica MIN (#52).
+
+El GovernanceResolver construye esta estrategia cuando tanto la App como
+el Agent declaran límites enforced. El límite más restrictivo siempre gana:
+el veredicto más severo de cualquiera de los dos hijos es el veredicto
+efectivo (HALT > WARN > APPROVED).
+
+El Kernel nunca sabe que hay dos Bursars — recibe una única estrategia
+pre-compilada, igual que con cualquier otra.
+"""
+
+from __future__ import annotations
+
+from xulcan.core.economics import UsageStats
+from xulcan.governance.bursar.base import BaseBursarConfig, BaseBursarStrategy
+from xulcan.governance.verdicts import BursarVerdict
+
+
+class CompositeBursarConfig(BaseBursarConfig):
+    """Sin parámetros propios. Los límites viven en los Bursars hijos."""
+    pass
+
+
+class CompositeBursarStrategy(BaseBursarStrategy):
+    """Evalúa App Bursar y Agent Bursar; el veredicto más severo gana.
+
+    Orden de severidad: HALT > WARN > APPROVED. Si cualquiera de los dos
+    hijos retorna HALT, el run se detiene con el contexto de límite del
+    hijo que lo excedió — el más restrictivo siempre gana (semántica MIN).
+
+    Construida exclusivamente por el GovernanceResolver en assembly time;
+    no es instanciable desde YAML.
+    """
+
+    ConfigSchema = CompositeBursarConfig
+
+    def __init__(
+        self,
+        app_bursar: BaseBursarStrategy,
+        agent_bursar: BaseBursarStrategy,
+    ):
+        super().__init__(config=CompositeBursarConfig())
+        self._app_bursar = app_bursar
+        self._agent_bursar = agent_bursar
+
+    def _check(self, cumulative_usage: UsageStats) -> BursarVerdict:
+        app_verdict = self._app_bursar._check(cumulative_usage)
+        agent_verdict = self._agent_bursar._check(cumulative_usage)
+
+        if BursarVerdict.HALT in (app_verdict, agent_verdict):
+            return BursarVerdict.HALT
+        if BursarVerdict.WARN in (app_verdict, agent_verdict):
+            return BursarVerdict.WARN
+        return BursarVerdict.APPROVED
+
+    def _raise_halt(self, cumulative_usage: UsageStats) -> None:
+        """Delegar al hijo que excedió su límite para un error preciso."""
+        if self._app_bursar._check(cumulative_usage) == BursarVerdict.HALT:
+            self._app_bursar._raise_halt(cumulative_usage)
+        self._agent_bursar._raise_halt(cumulative_usage)
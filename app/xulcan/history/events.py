@@ -17,15 +17,17 @@ should happen next (that's the Kernel's job).
 
 from __future__ import annotations
 
+import os
 import uuid
 from datetime import datetime, timezone
 from typing import Literal, Annotated
 from enum import Enum
-from pydantic import Field, field_validator
+from pydantic import Field, TypeAdapter, field_validator
 
 from xulcan.core.primitives import (
-    ImmutableRecord, 
+    ImmutableRecord,
     MachineID,
+    UniqueID,
     SemanticText,
     ExternalID,
     JsonDict,
@@ -83,6 +85,79 @@ class RunStatus(str, Enum):
     FAILED = "failed"
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# CLASSIFICATION SETS
+# ═══════════════════════════════════════════════════════════════════════════
+# Preallocated frozensets (same pattern as VALID_TRANSITIONS in the Kernel
+# FSM): classification predicates resolve as a single hash lookup instead of
+# building a fresh tuple and scanning it on every event in a replay loop.
+
+TERMINAL_EVENT_TYPES = frozenset({EventType.RUN_COMPLETED, EventType.RUN_FAILED})
+"""Event types after which no more events may be appended to a run's ledger."""
+
+LLM_EVENT_TYPES = frozenset({
+    EventType.MODEL_REQUEST, EventType.MODEL_RESPONSE, EventType.MODEL_FALLBACK
+})
+"""Event types produced by LLM provider interactions."""
+
+TOOL_EVENT_TYPES = frozenset({EventType.TOOL_EXECUTION, EventType.TOOL_OUTPUT})
+"""Event types produced by tool execution."""
+
+HUMAN_EVENT_TYPES = frozenset({
+    EventType.HUMAN_INTERVENTION_REQUIRED, EventType.HUMAN_INTERVENTION_RESULT
+})
+"""Event types produced by human-in-the-loop interactions."""
+
+_TERMINAL_STATUSES = frozenset({RunStatus.COMPLETED, RunStatus.FAILED})
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# EVENT ID GENERATION
+# ═══════════════════════════════════════════════════════════════════════════
+# str(uuid.uuid4()) pays a 16-byte os.urandom syscall per event. High-volume
+# emission (ingestion, replay, fork) amortizes that by drawing entropy for a
+# whole batch at once and formatting the ids up front. The pool is keyed to
+# the current pid so a forked worker never replays ids drawn by its parent,
+# and refills go through list.pop()/extend(), which are atomic under the GIL.
+
+_UTC = timezone.utc
+"""Module-bound UTC tzinfo so per-event timestamping skips the
+datetime-module attribute lookup; also shared by the UTC validator below."""
+
+
+def _utc_now() -> datetime:
+    """Timezone-aware current time, used as the timestamp default factory."""
+    return datetime.now(_UTC)
+
+
+_UUID_POOL_SIZE = 256
+_uuid_pool: list[str] = []
+_uuid_pool_pid = 0
+
+
+def _next_event_id() -> str:
+    """Returns a random UUID4 string, drawing entropy in amortized batches."""
+    global _uuid_pool_pid
+    pid = os.getpid()
+    if pid == _uuid_pool_pid:
+        try:
+            return _uuid_pool.pop()
+        except IndexError:
+            pass
+    else:
+        _uuid_pool.clear()
+        _uuid_pool_pid = pid
+
+    raw = os.urandom(16 * _UUID_POOL_SIZE)
+    batch = [
+        str(uuid.UUID(bytes=raw[i:i + 16], version=4))
+        for i in range(0, len(raw), 16)
+    ]
+    event_id = batch.pop()
+    _uuid_pool.extend(batch)
+    return event_id
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # BASE EVENT (ABSTRACT)
 # ═══════════════════════════════════════════════════════════════════════════
@@ -101,8 +176,12 @@ class BaseRunEvent(ImmutableRecord):
     """
     type: EventType
 
-    id: MachineID = Field(
-        default_factory=lambda: str(uuid.uuid4()),
+    # UniqueID, not MachineID: every event id is a fresh UUID, so routing it
+    # through the memoizing validator would be a guaranteed cache miss that
+    # evicts a repeating identifier (run ids, tool names) and interns a
+    # string that is never compared again.
+    id: UniqueID = Field(
+        default_factory=_next_event_id,
         description="Unique event identifier (UUID v4)."
     )
     
@@ -111,7 +190,7 @@ class BaseRunEvent(ImmutableRecord):
     )
     
     timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=_utc_now,
         description="When this event occurred (always UTC)."
     )
 
@@ -130,14 +209,39 @@ class BaseRunEvent(ImmutableRecord):
         description="Tracing info (user_id, correlation_id, app_version, etc.)."
     )
 
+    @property
+    def is_terminal_event(self) -> bool:
+        """True if no more events may follow this one in the run's ledger."""
+        return self.type in TERMINAL_EVENT_TYPES
+
+    @property
+    def is_llm_event(self) -> bool:
+        """True if this event was produced by an LLM provider interaction."""
+        return self.type in LLM_EVENT_TYPES
+
+    @property
+    def is_tool_event(self) -> bool:
+        """True if this event was produced by tool execution."""
+        return self.type in TOOL_EVENT_TYPES
+
+    @property
+    def is_human_event(self) -> bool:
+        """True if this event involves a human operator."""
+        return self.type in HUMAN_EVENT_TYPES
+
     @field_validator('timestamp', mode="after")
     @classmethod
     def validate_timestamp_is_utc(cls, value: datetime) -> datetime:
         """Ensure timestamp is timezone-aware and normalized to UTC."""
+        # The default factory stamps events with the timezone.utc singleton,
+        # so nearly every timestamp takes this identity check and skips the
+        # heavier timezone.__eq__ (offset comparison) below.
+        if value.tzinfo is _UTC:
+            return value
         if value.tzinfo is None:
             raise ValueError("Timestamp must be timezone-aware.")
-        if value.tzinfo != timezone.utc:
-            value = value.astimezone(timezone.utc)
+        if value.tzinfo != _UTC:
+            value = value.astimezone(_UTC)
         return value
 
 
@@ -462,6 +566,16 @@ RunEvent = Annotated[
     Field(discriminator='type')
 ]
 
+RUN_EVENT_ADAPTER = TypeAdapter(RunEvent)
+"""Precompiled adapter for deserializing tape data back into typed events.
+
+Ledger adapters that persist events (JSON, SQL rows, ...) should rehydrate
+through this singleton — RUN_EVENT_ADAPTER.validate_python(raw_dict) — so
+the discriminator dispatch table is built once at import instead of per
+replay call. Mirrors the TypeAdapter(InfraEvent) pattern documented in
+infra_events.py.
+"""
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # READ MODELS (PROJECTIONS)
@@ -500,7 +614,7 @@ class RunSummary(ImmutableRecord):
     @property
     def is_terminal(self) -> bool:
         """True if the run has reached a final state."""
-        return self.status in (RunStatus.COMPLETED, RunStatus.FAILED)
+        return self.status in _TERMINAL_STATUSES
 
 """
 ═══════════════════════════════════════════════════════════════════════════
@@ -67,6 +67,7 @@ from xulcan.history.events import (
 )
 
 from xulcan.protocol.message import (
+    MESSAGE_LIST_ADAPTER,
     UnifiedMessage,
     SystemMessage,
     UserMessage,
@@ -780,8 +781,6 @@ class ProtoKernel:
         Raises:
             RunNotSuspendedError: If the run is not suspended or doesn't exist.
         """
-        from pydantic import TypeAdapter
-
         self._log("🔄", f"Attempting to resume run {run_id}", run_id=run_id)
 
         # 1. Validar que StateStore está disponible
@@ -800,7 +799,7 @@ class ProtoKernel:
             raise RunNotSuspendedError(run_id)
 
         # 3. Rehidratar contexto con polimorfismo Pydantic
-        context: list[UnifiedMessage] = TypeAdapter(list[UnifiedMessage]).validate_python(
+        context: list[UnifiedMessage] = MESSAGE_LIST_ADAPTER.validate_python(
             suspension_data["context"]
         )
 
@@ -7,6 +7,7 @@ from __future__ import annotations
 import time
 import uuid
 import json
+import orjson
 from typing import Any
 from pydantic import Field
 
@@ -24,6 +25,7 @@ from xulcan.protocol.message import (
 from xulcan.protocol.parts import TextPart
 from xulcan.protocol.io import UnifiedResponse, FinishReason
 from xulcan.protocol.tools import ToolCall, ToolDefinition
+from xulcan.llm.adapters.common.serialization import dump_tool_arguments
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -90,7 +92,7 @@ class CohereAdapter(BaseLLMAdapter):
                             "type": "function",
                             "function": {
                                 "name": tc.name,
-                                "arguments": json.dumps(tc.arguments)
+                                "arguments": dump_tool_arguments(tc.arguments)
                             }
                         }
                         for tc in msg.tool_calls
@@ -158,8 +160,8 @@ class CohereAdapter(BaseLLMAdapter):
                 args_dict = tc.function.arguments
                 if isinstance(args_dict, str):
                     try:
-                        args_dict = json.loads(args_dict)
-                    except json.JSONDecodeError:
+                        args_dict = orjson.loads(args_dict)
+                    except orjson.JSONDecodeError:
                         args_dict = {"raw_arguments": args_dict}
 
                 extracted_tools.append(ToolCall(
@@ -186,7 +188,9 @@ class CohereAdapter(BaseLLMAdapter):
             content=final_text if final_text else None,
             tool_calls=extracted_tools if extracted_tools else None,
             finish_reason=finish_reason,
-            usage=UsageStats(
+            # Valores de confianza: total = in + out por construcción y la latencia
+            # es finita por medición — se omite la revalidación en el hot path.
+            usage=UsageStats.from_trusted(
                 input_tokens=in_tokens,
                 output_tokens=out_tokens,
                 total_tokens=in_tokens + out_tokens,
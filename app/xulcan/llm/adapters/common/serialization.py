@@ -0,0 +1,30 @@
+"""Shared serialization helpers for provider adapters."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import orjson
+
+
+def dump_tool_arguments(arguments: dict[str, Any]) -> str:
+    """Serializes tool-call arguments to a compact JSON string.
+
+    orjson handles the common case several times faster than the stdlib,
+    with OPT_NON_STR_KEYS mirroring json.dumps' key coercion. It is
+    stricter on one point, though: integers outside the 64-bit range raise
+    TypeError, while the JsonDict validator (like the stdlib) accepts
+    them. Fall back to json.dumps for those rare payloads so a validated
+    arguments dict can always be egressed instead of failing the request.
+
+    Args:
+        arguments: The JSON-serializable arguments dict of a ToolCall.
+
+    Returns:
+        The arguments encoded as a compact JSON string.
+    """
+    try:
+        return orjson.dumps(arguments, option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        return json.dumps(arguments, separators=(",", ":"))
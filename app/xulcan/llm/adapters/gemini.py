@@ -204,7 +204,9 @@ class GeminiAdapter(BaseLLMAdapter):
             content=text_content if text_content else None,
             tool_calls=tool_calls_out if tool_calls_out else None,
             finish_reason=finish_reason,
-            usage=UsageStats(
+            # Valores de confianza: total = in + out por construcción y la latencia
+            # es finita por medición — se omite la revalidación en el hot path.
+            usage=UsageStats.from_trusted(
                 input_tokens=in_tokens,
                 output_tokens=out_tokens,
                 total_tokens=in_tokens + out_tokens,
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import time
 import json
+import orjson
 import uuid
 from typing import Any
 from pydantic import Field
@@ -26,6 +27,7 @@ from xulcan.protocol.message import (
 from xulcan.protocol.parts import TextPart, ImagePart
 from xulcan.protocol.io import UnifiedResponse, FinishReason
 from xulcan.protocol.tools import ToolCall, ToolDefinition
+from xulcan.llm.adapters.common.serialization import dump_tool_arguments
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -106,7 +108,7 @@ class MistralAdapter(BaseLLMAdapter):
                             "type": "function",
                             "function": {
                                 "name": tc.name,
-                                "arguments": json.dumps(tc.arguments)
+                                "arguments": dump_tool_arguments(tc.arguments)
                             }
                         }
                         for tc in msg.tool_calls
@@ -175,8 +177,8 @@ class MistralAdapter(BaseLLMAdapter):
                 try:
                     # Mistral SDK sometimes returns arguments as dict or string depending on version
                     args = tc.function.arguments
-                    args_dict = json.loads(args) if isinstance(args, str) else args
-                except json.JSONDecodeError:
+                    args_dict = orjson.loads(args) if isinstance(args, str) else args
+                except orjson.JSONDecodeError:
                     args_dict = {"raw_arguments": str(tc.function.arguments)}
 
                 extracted_tools.append(ToolCall(
@@ -205,7 +207,9 @@ class MistralAdapter(BaseLLMAdapter):
             content=final_text if final_text else None,
             tool_calls=extracted_tools if extracted_tools else None,
             finish_reason=finish_reason,
-            usage=UsageStats(
+            # Valores de confianza: total = in + out por construcción y la latencia
+            # es finita por medición — se omite la revalidación en el hot path.
+            usage=UsageStats.from_trusted(
                 input_tokens=in_tokens,
                 output_tokens=out_tokens,
                 total_tokens=in_tokens + out_tokens,
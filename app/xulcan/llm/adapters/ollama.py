@@ -185,7 +185,9 @@ class OllamaAdapter(BaseLLMAdapter):
             reasoning_content=reasoning if reasoning else None,
             tool_calls=tool_calls_out if tool_calls_out else None,
             finish_reason=FinishReason.TOOL_CALLS if tool_calls_out else FinishReason.STOP,
-            usage=UsageStats(
+            # Valores de confianza: total = in + out por construcción y la latencia
+            # es finita por medición — se omite la revalidación en el hot path.
+            usage=UsageStats.from_trusted(
                 input_tokens=in_tokens, 
                 output_tokens=out_tokens, 
                 total_tokens=in_tokens + out_tokens,
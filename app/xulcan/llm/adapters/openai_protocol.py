@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import time
-import json
+import orjson
 from typing import Any
 from pydantic import Field
 from openai import AsyncOpenAI
@@ -19,6 +19,7 @@ from xulcan.protocol.message import (
 from xulcan.protocol.parts import TextPart, ImagePart, AudioPart
 from xulcan.protocol.io import UnifiedResponse, FinishReason
 from xulcan.protocol.tools import ToolCall, ToolDefinition
+from xulcan.llm.adapters.common.serialization import dump_tool_arguments
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -115,7 +116,7 @@ class OpenAICompatibleAdapter(BaseLLMAdapter):
                             "type": "function",
                             "function": {
                                 "name": tc.name,
-                                "arguments": json.dumps(tc.arguments)
+                                "arguments": dump_tool_arguments(tc.arguments)
                             }
                         }
                         for tc in msg.tool_calls
@@ -187,8 +188,8 @@ class OpenAICompatibleAdapter(BaseLLMAdapter):
         if msg_out.tool_calls:
             for tc in msg_out.tool_calls:
                 try:
-                    args_dict = json.loads(tc.function.arguments)
-                except json.JSONDecodeError:
+                    args_dict = orjson.loads(tc.function.arguments)
+                except orjson.JSONDecodeError:
                     # Si el LLM alucina JSON inválido, lo pasamos como raw_arguments
                     # El ToolExecutor o el Sentinel se encargarán de rechazarlo.
                     args_dict = {"raw_arguments": tc.function.arguments}
@@ -218,7 +219,9 @@ class OpenAICompatibleAdapter(BaseLLMAdapter):
             content=msg_out.content,
             tool_calls=extracted_tools if extracted_tools else None,
             finish_reason=finish_reason,
-            usage=UsageStats(
+            # Valores de confianza: total = in + out por construcción y la latencia
+            # es finita por medición — se omite la revalidación en el hot path.
+            usage=UsageStats.from_trusted(
                 input_tokens=in_tokens,
                 output_tokens=out_tokens,
                 total_tokens=in_tokens + out_tokens,
@@ -11,8 +11,9 @@ import os
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import Depends, FastAPI, HTTPException, Request, status
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import Depends, FastAPI, Request, Response, status
+from fastapi.responses import ORJSONResponse
 
 from xulcan.api.middleware import RequestCorrelationMiddleware
 from xulcan.config import Settings, get_settings
@@ -20,6 +21,7 @@ from xulcan.logging_config import (
     configure_structlog_wrapper,
     get_logger,
     get_logging_config,
+    request_id_var,
 )
 
 
@@ -54,6 +56,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger = get_logger("lifespan")
     logger.info("🚀 Xulcan System Startup Initiated", extra={"env": settings.ENVIRONMENT})
 
+    # Not ready until initialization succeeds; setting it before the try
+    # guarantees the attribute exists so the readiness probe can read it
+    # directly, without a defaulted getattr.
+    app.state.is_ready = False
+
     # Initialize shared resources and attach to app.state for dependency injection
     try:
         app.state.is_ready = True
@@ -77,10 +84,17 @@ app = FastAPI(
     version=os.getenv("VERSION", "0.1.0"),
     description="API-first framework for AI Agent orchestration",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(RequestCorrelationMiddleware)
 
+# Guarantee the readiness flag exists from the moment the app object does,
+# so the probe can read it with a plain attribute access. getattr with a
+# default swallows AttributeError through try/except in CPython, which is
+# slower than a direct lookup on a path K8s polls for the life of the pod.
+app.state.is_ready = False
+
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -102,18 +116,37 @@ async def global_exception_handler(request: Request, exc: Exception):
         exc_info=True  # This ensures the stack trace is included in the log
     )
     
-    return JSONResponse(
+    # The middleware already bound the request ID for this request's
+    # context, so read it from there instead of re-parsing headers on the
+    # error path. orjson serializes the small payload without
+    # JSONResponse's json.dumps.
+    return Response(
+        content=orjson.dumps({
+            "detail": "Internal Server Error",
+            # Include request_id in the error response for support
+            "request_id": request_id_var.get() or None,
+        }),
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "detail": "Internal Server Error", 
-            # Optionally include request_id in the error response for support
-            "request_id": request.headers.get("X-Request-ID") 
-        },
+        media_type="application/json",
     )
 
 
+# Health probes are polled on a fixed schedule for the life of every pod.
+# Precompute the constant responses once at import time so each hit is a
+# zero-allocation return instead of a fresh dict + serialization pass.
+_LIVE_RESPONSE = ORJSONResponse({"status": "alive"})
+_READY_RESPONSE = ORJSONResponse({"status": "ready"})
+_NOT_READY_RESPONSE = ORJSONResponse(
+    {"detail": "System is starting up or dependencies are unavailable"},
+    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+)
+_LEGACY_HEALTH_RESPONSE = ORJSONResponse(
+    {"status": "ok", "note": "deprecated: use /health/live or /health/ready"}
+)
+
+
 @app.get("/health/live", status_code=status.HTTP_200_OK)
-async def liveness_probe() -> dict[str, str]:
+async def liveness_probe() -> Response:
     """Return liveness status for container orchestration.
 
     Provide a lightweight endpoint for orchestrators (e.g., Kubernetes) to
@@ -121,13 +154,13 @@ async def liveness_probe() -> dict[str, str]:
     verify external dependencies such as databases or caches.
 
     Returns:
-        dict[str, str]: Status indicator confirming the process is alive.
+        Response: Precomputed status payload confirming the process is alive.
     """
-    return {"status": "alive"}
+    return _LIVE_RESPONSE
 
 
 @app.get("/health/ready", status_code=status.HTTP_200_OK)
-async def readiness_probe(request: Request) -> dict[str, str]:
+async def readiness_probe(request: Request) -> Response:
     """Return readiness status for traffic routing decisions.
 
     Verify that the application has completed initialization and all critical
@@ -138,28 +171,22 @@ async def readiness_probe(request: Request) -> dict[str, str]:
         request: Incoming HTTP request object.
 
     Returns:
-        dict[str, str]: Status indicator confirming readiness.
-
-    Raises:
-        HTTPException: 503 Service Unavailable when dependencies are not ready.
+        Response: Precomputed 200 payload when ready, 503 otherwise.
     """
-    if not getattr(request.app.state, "is_ready", False):
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="System is starting up or dependencies are unavailable"
-        )
+    if not request.app.state.is_ready:
+        return _NOT_READY_RESPONSE
 
-    return {"status": "ready"}
+    return _READY_RESPONSE
 
 
 @app.get("/health", include_in_schema=False)
-async def legacy_health() -> dict[str, str]:
+async def legacy_health() -> Response:
     """Return health status for backward compatibility.
 
     .. deprecated::
         Use ``/health/live`` or ``/health/ready`` instead.
 
     Returns:
-        dict[str, str]: Status with deprecation notice.
+        Response: Precomputed status payload with deprecation notice.
     """
-    return {"status": "ok", "note": "deprecated: use /health/live or /health/ready"}
\ No newline at end of file
+    return _LEGACY_HEALTH_RESPONSE
\ No newline at end of file
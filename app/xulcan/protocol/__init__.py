@@ -1,17 +1,17 @@
 """Protocol dimension: Messages, parts, tools, and IO for model communication."""
 
-from .parts import ContentPart, TextPart, ImagePart, AudioPart, ContentType
-from .tools import ToolCall, FunctionDef, ToolDefinition, NamedToolChoice, ToolChoice, ToolChoiceType
-from .message import UnifiedMessage, SystemMessage, UserMessage, AssistantMessage, ToolMessage, Role
-from .io import UnifiedResponse, DeltaContent, UnifiedChunk, FinishReason
+from .parts import ContentPart, TextPart, ImagePart, AudioPart, ContentType, CONTENT_PART_ADAPTER
+from .tools import ToolCall, FunctionDef, FunctionIdentity, ToolDefinition, NamedToolChoice, ToolChoice, ToolChoiceType
+from .message import UnifiedMessage, SystemMessage, UserMessage, AssistantMessage, ToolMessage, Role, MESSAGE_ADAPTER
+from .io import UnifiedResponse, DeltaContent, DeltaAccumulator, UnifiedChunk, FinishReason
 
 __all__ =[
     # Parts
-    "ContentPart", "TextPart", "ImagePart", "AudioPart", "ContentType",
+    "ContentPart", "TextPart", "ImagePart", "AudioPart", "ContentType", "CONTENT_PART_ADAPTER",
     # Tools
-    "ToolCall", "FunctionDef", "ToolDefinition", "NamedToolChoice", "ToolChoice", "ToolChoiceType",
+    "ToolCall", "FunctionDef", "FunctionIdentity", "ToolDefinition", "NamedToolChoice", "ToolChoice", "ToolChoiceType",
     # Messages
-    "UnifiedMessage", "SystemMessage", "UserMessage", "AssistantMessage", "ToolMessage", "Role",
+    "UnifiedMessage", "SystemMessage", "UserMessage", "AssistantMessage", "ToolMessage", "Role", "MESSAGE_ADAPTER",
     # IO / Responses
-    "UnifiedResponse", "DeltaContent", "UnifiedChunk", "FinishReason"
+    "UnifiedResponse", "DeltaContent", "DeltaAccumulator", "UnifiedChunk", "FinishReason"
 ]
\ No newline at end of file
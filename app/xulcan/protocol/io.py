@@ -10,6 +10,7 @@ Response Types:
     - UnifiedResponse: Complete, finalized response from synchronous generation.
     - DeltaContent: Incremental update in a streaming response.
     - UnifiedChunk: Single event in a streaming response sequence.
+    - DeltaAccumulator: Allocation-efficient reconstruction of streamed text.
 
 Security Features:
     - Substantive content validation rejects empty responses.
@@ -22,6 +23,7 @@ Enums:
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field as dc_field
 from typing import Literal
 from enum import Enum
 
@@ -36,7 +38,7 @@ from xulcan.core.primitives import (
 from xulcan.core.economics import UsageStats
 
 from .tools import ToolCall
-from .utils import MAX_CHUNK_SIZE
+from .utils import MAX_CHUNK_SIZE, _nonblank
 
 
 # =============================================================================
@@ -149,12 +151,12 @@ class UnifiedResponse(ImmutableRecord):
         Raises:
             ValueError: If all content fields are empty or None.
         """
-        has_content = bool(self.content and self.content.strip())
-        has_reasoning = bool(self.reasoning_content and self.reasoning_content.strip())
-        has_refusal = bool(self.refusal and self.refusal.strip())
-        has_tool_calls = bool(self.tool_calls)
-
-        if not any([has_content, has_reasoning, has_refusal, has_tool_calls]):
+        if not (
+            _nonblank(self.content)
+            or _nonblank(self.reasoning_content)
+            or _nonblank(self.refusal)
+            or self.tool_calls
+        ):
             raise ValueError(
                 "UnifiedResponse must contain substantive data in at least one field. "
                 "Received: content={}, reasoning_content={}, refusal={}, tool_calls={}. "
@@ -287,6 +289,63 @@ class DeltaContent(ImmutableRecord):
         return self
 
 
+@dataclass(slots=True)
+class DeltaAccumulator:
+    """Mutable accumulator for reconstructing a response from stream deltas.
+
+    Naive clients concatenate with ``acc += chunk.delta.content``, which
+    allocates a fresh string per chunk and degrades to O(N^2) character
+    copies over a long stream. This sibling follows the string-builder
+    idiom used by ``UsageAccumulator`` in core/economics.py: append chunk
+    fragments to slotted list buffers, then join each channel exactly once
+    at the end.
+
+    Tool-call deltas are not handled here — merging partial ToolCallDelta
+    objects by index is provider-specific and stays with the caller.
+
+    Example:
+        >>> acc = DeltaAccumulator()
+        >>> async for chunk in stream:
+        ...     acc.add(chunk.delta)
+        >>> full_text = acc.content
+    """
+    _content: list[str] = dc_field(default_factory=list)
+    _reasoning: list[str] = dc_field(default_factory=list)
+    _refusal: list[str] = dc_field(default_factory=list)
+
+    def add(self, delta: DeltaContent) -> DeltaAccumulator:
+        """Appends one delta's string fragments in-place.
+
+        Args:
+            delta: The incremental update to fold into the buffers.
+
+        Returns:
+            DeltaAccumulator: self, to allow chained folding.
+        """
+        if delta.content is not None:
+            self._content.append(delta.content)
+        if delta.reasoning_content is not None:
+            self._reasoning.append(delta.reasoning_content)
+        if delta.refusal is not None:
+            self._refusal.append(delta.refusal)
+        return self
+
+    @property
+    def content(self) -> str | None:
+        """The accumulated response text, or None if no chunk carried any."""
+        return "".join(self._content) if self._content else None
+
+    @property
+    def reasoning_content(self) -> str | None:
+        """The accumulated reasoning text, or None if no chunk carried any."""
+        return "".join(self._reasoning) if self._reasoning else None
+
+    @property
+    def refusal(self) -> str | None:
+        """The accumulated refusal text, or None if no chunk carried any."""
+        return "".join(self._refusal) if self._refusal else None
+
+
 class UnifiedChunk(ImmutableRecord):
     """Represents a single event in a streaming response sequence.
 
@@ -29,7 +29,7 @@ from __future__ import annotations
 from typing import Literal, Annotated
 from enum import Enum
 
-from pydantic import Field, model_validator, field_validator
+from pydantic import Field, TypeAdapter, model_validator, field_validator
 
 from xulcan.core.primitives import (
     ImmutableRecord,
@@ -42,6 +42,7 @@ from xulcan.core.primitives import (
 
 from .parts import ContentPart
 from .tools import ToolCall
+from .utils import _nonblank
 
 
 # =============================================================================
@@ -128,7 +129,7 @@ class SystemMessage(BaseMessage):
         Raises:
             ValueError: If the content is empty or whitespace-only.
         """
-        if not value.strip():
+        if not _nonblank(value):
             raise ValueError("System message content cannot be empty or whitespace-only.")
         return value
 
@@ -190,7 +191,7 @@ class UserMessage(BaseMessage):
         if isinstance(value, list) and not value:
             raise ValueError("Content list cannot be empty.")
 
-        if isinstance(value, str) and not value.strip():
+        if isinstance(value, str) and not _nonblank(value):
             raise ValueError("Content cannot be empty or whitespace-only.")
 
         return value
@@ -324,12 +325,12 @@ class AssistantMessage(BaseMessage):
         Raises:
             ValueError: If all content fields are non-substantive.
         """
-        has_content = bool(self.content and self.content.strip())
-        has_reasoning = bool(self.reasoning_content and self.reasoning_content.strip())
-        has_refusal = bool(self.refusal and self.refusal.strip())
-        has_tool_calls = bool(self.tool_calls)
-
-        if not any([has_content, has_reasoning, has_refusal, has_tool_calls]):
+        if not (
+            _nonblank(self.content)
+            or _nonblank(self.reasoning_content)
+            or _nonblank(self.refusal)
+            or self.tool_calls
+        ):
             raise ValueError(
                 "AssistantMessage must have at least one substantive field. "
                 "Received: content={}, reasoning_content={}, refusal={}, tool_calls={}. "
@@ -354,3 +355,16 @@ UnifiedMessage = Annotated[
     SystemMessage | UserMessage | ToolMessage | AssistantMessage,
     Field(discriminator='role')
 ]
+
+MESSAGE_ADAPTER = TypeAdapter(UnifiedMessage)
+"""Precompiled adapter for validating raw provider payloads into messages.
+
+Built once at import so the discriminator dispatch table is compiled ahead
+of the first request instead of lazily on first use. Callers ingesting
+untyped dicts should prefer MESSAGE_ADAPTER.validate_python(raw) over
+constructing a throwaway TypeAdapter per call.
+"""
+
+MESSAGE_LIST_ADAPTER = TypeAdapter(list[UnifiedMessage])
+"""Precompiled adapter for rehydrating conversation histories (e.g. from
+the StateStore on run resume) without rebuilding the union schema per call."""
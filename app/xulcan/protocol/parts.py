@@ -18,6 +18,8 @@ Classes:
 
 Type Aliases:
     ContentPart: Discriminated union of all content types
+    ImageMime: MIME type constrained to the safe image allowlist
+    AudioMime: MIME type constrained to the safe audio allowlist
 
 Enums:
     ContentType: Discriminates between multimodal content types
@@ -28,7 +30,7 @@ from __future__ import annotations
 from typing import Literal, Annotated, Any
 from enum import Enum
 
-from pydantic import Field, field_validator, model_validator
+from pydantic import AfterValidator, Field, TypeAdapter, field_validator, model_validator
 
 from xulcan.core.primitives import (
     ImmutableRecord,
@@ -38,6 +40,8 @@ from xulcan.core.primitives import (
     Base64Data,
 )
 
+from .utils import _nonblank
+
 
 # =============================================================================
 # CONSTANTS & SECURITY BOUNDARIES
@@ -62,6 +66,62 @@ SAFE_AUDIO_MIMES = frozenset({
 """Allowed MIME types for audio content to prevent executable uploads."""
 
 
+def _check_image_mime(value: str) -> str:
+    """Enforces the image MIME allowlist to prevent arbitrary file uploads.
+
+    Runs after MimeType normalization, so the value is already lowercase
+    and format-checked; only the membership test remains.
+
+    Args:
+        value: The normalized MIME type string to validate.
+
+    Returns:
+        The validated MIME type string.
+
+    Raises:
+        ValueError: If the MIME type is not in the safe image allowlist.
+    """
+    if value not in SAFE_IMAGE_MIMES:
+        raise ValueError(
+            f"Unsupported image MIME type: '{value}'. "
+            f"Allowed types: {SAFE_IMAGE_MIMES}. "
+            f"This restriction prevents upload of executable content."
+        )
+    return value
+
+
+def _check_audio_mime(value: str) -> str:
+    """Enforces the audio MIME allowlist to prevent arbitrary file uploads.
+
+    Args:
+        value: The normalized MIME type string to validate.
+
+    Returns:
+        The validated MIME type string.
+
+    Raises:
+        ValueError: If the MIME type is not in the safe audio allowlist.
+    """
+    if value not in SAFE_AUDIO_MIMES:
+        raise ValueError(
+            f"Unsupported audio MIME type: '{value}'. "
+            f"Allowed types: {SAFE_AUDIO_MIMES}. "
+            f"This restriction prevents upload of executable content."
+        )
+    return value
+
+
+ImageMime = Annotated[MimeType, AfterValidator(_check_image_mime)]
+"""MIME type constrained to the safe image allowlist.
+
+Sharing one Annotated type between all image parts gives pydantic-core a
+single validator node instead of a per-class classmethod closure.
+"""
+
+AudioMime = Annotated[MimeType, AfterValidator(_check_audio_mime)]
+"""MIME type constrained to the safe audio allowlist."""
+
+
 # =============================================================================
 # DOMAIN ENUMERATIONS
 # =============================================================================
@@ -123,7 +183,7 @@ class TextPart(ImmutableRecord):
         Raises:
             ValueError: If the value is empty or contains only whitespace.
         """
-        if not value.strip():
+        if not _nonblank(value):
             raise ValueError("TextPart.text cannot be empty or whitespace-only.")
         return value
 
@@ -162,7 +222,7 @@ class ImagePart(ImmutableRecord):
         ... )
     """
     type: Literal[ContentType.IMAGE] = ContentType.IMAGE
-    media_type: MimeType = Field(
+    media_type: ImageMime = Field(
         default="image/jpeg",
         description="MIME type constrained to safe image formats."
     )
@@ -217,49 +277,26 @@ class ImagePart(ImmutableRecord):
 
         return value
 
-    @field_validator("media_type", mode="after")
-    @classmethod
-    def validate_mime_type(cls, value: str) -> str:
-        """Enforces MIME type allowlist to prevent arbitrary file uploads.
-
-        Args:
-            value: The MIME type string to validate.
-
-        Returns:
-            The normalized lowercase MIME type.
-
-        Raises:
-            ValueError: If the MIME type is not in the safe image allowlist.
-        """
-        v_norm = value.strip().lower()
-        if v_norm not in SAFE_IMAGE_MIMES:
-            raise ValueError(
-                f"Unsupported image MIME type: '{value}'. "
-                f"Allowed types: {SAFE_IMAGE_MIMES}. "
-                f"This restriction prevents upload of executable content."
-            )
-        return v_norm
-
     @model_validator(mode='after')
     def validate_source(self) -> ImagePart:
         """Ensures exactly one source is provided (data XOR url).
 
+        The happy path is a single equality test: exactly one source means
+        the two None-checks disagree. Message selection only runs on the
+        failure path.
+
         Returns:
             ImagePart: The validated instance.
 
         Raises:
             ValueError: If neither or both sources are specified.
         """
-        has_data = self.data is not None
-        has_url = self.url is not None
-
-        if not has_data and not has_url:
-            raise ValueError(
-                "ImagePart must specify either 'data' or 'url' source. "
-                "Without a source, the image cannot be rendered."
-            )
-
-        if has_data and has_url:
+        if (self.data is None) == (self.url is None):
+            if self.data is None:
+                raise ValueError(
+                    "ImagePart must specify either 'data' or 'url' source. "
+                    "Without a source, the image cannot be rendered."
+                )
             raise ValueError(
                 "ImagePart cannot specify both 'data' and 'url'. "
                 "Ambiguous sources prevent deterministic processing."
@@ -288,7 +325,7 @@ class AudioPart(ImmutableRecord):
         ... )
     """
     type: Literal[ContentType.AUDIO] = ContentType.AUDIO
-    media_type: MimeType = Field(
+    media_type: AudioMime = Field(
         default="audio/wav",
         description="MIME type constrained to safe audio formats."
     )
@@ -339,46 +376,22 @@ class AudioPart(ImmutableRecord):
 
         return value
 
-    @field_validator("media_type", mode="after")
-    @classmethod
-    def validate_mime_type(cls, value: str) -> str:
-        """Enforces MIME type allowlist for audio formats.
-
-        Args:
-            value: The MIME type string to validate.
-
-        Returns:
-            The normalized lowercase MIME type.
-
-        Raises:
-            ValueError: If the MIME type is not in the safe audio allowlist.
-        """
-        v_norm = value.strip().lower()
-        if v_norm not in SAFE_AUDIO_MIMES:
-            raise ValueError(
-                f"Unsupported audio MIME type: '{value}'. "
-                f"Allowed types: {SAFE_AUDIO_MIMES}. "
-                f"This restriction prevents upload of executable content."
-            )
-        return v_norm
-
     @model_validator(mode='after')
     def validate_source(self) -> AudioPart:
         """Ensures exactly one source is provided (data XOR url).
 
+        Mirrors ImagePart: one equality test on the happy path, message
+        selection deferred to the failure path.
+
         Returns:
             AudioPart: The validated instance.
 
         Raises:
             ValueError: If neither or both sources are specified.
         """
-        has_data = self.data is not None
-        has_url = self.url is not None
-
-        if not has_data and not has_url:
-            raise ValueError("AudioPart must specify either 'data' or 'url' source.")
-
-        if has_data and has_url:
+        if (self.data is None) == (self.url is None):
+            if self.data is None:
+                raise ValueError("AudioPart must specify either 'data' or 'url' source.")
             raise ValueError(
                 "AudioPart cannot specify both 'data' and 'url'. "
                 "Ambiguous sources prevent deterministic processing."
@@ -397,3 +410,10 @@ ContentPart = Annotated[
     TextPart | ImagePart | AudioPart,
     Field(discriminator='type')
 ]
+
+CONTENT_PART_ADAPTER = TypeAdapter(ContentPart)
+"""Precompiled adapter for validating raw multimodal parts.
+
+Built once at import so the tag-dispatch table exists before the first
+request; mirrors MESSAGE_ADAPTER in message.py.
+"""
@@ -42,6 +42,20 @@ from xulcan.core.primitives import (
 )
 
 
+# =============================================================================
+# CONSTANTS & SECURITY BOUNDARIES
+# =============================================================================
+
+_PYTHON_KEYWORDS = frozenset(keyword.kwlist)
+"""Reserved words rejected as function names.
+
+Bound once at import so the per-construction check is a plain frozenset
+membership test instead of a keyword.iskeyword call. Soft keywords
+('match', 'case', 'type', '_') are deliberately excluded — they are valid
+identifiers and legitimate tool names.
+"""
+
+
 # =============================================================================
 # DOMAIN ENUMERATIONS
 # =============================================================================
@@ -180,7 +194,7 @@ class FunctionDef(ImmutableRecord):
         Raises:
             ValueError: If the name is a Python reserved keyword.
         """
-        if keyword.iskeyword(value):
+        if value in _PYTHON_KEYWORDS:
             raise ValueError(
                 f"Function name '{value}' is a reserved Python keyword. "
                 f"This could enable code injection in execution contexts."
@@ -230,7 +244,7 @@ class FunctionIdentity(ImmutableRecord):
         Raises:
             ValueError: If the name is a Python reserved keyword.
         """
-        if keyword.iskeyword(value):
+        if value in _PYTHON_KEYWORDS:
             raise ValueError(
                 f"Function name '{value}' is a reserved Python keyword. "
                 f"This could enable code injection in execution contexts."
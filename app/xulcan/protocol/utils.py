@@ -13,9 +13,10 @@ Constants:
 Functions:
     _validate_recursion_depth: Validates that data structures don't exceed
         maximum nesting depth, protecting against maliciously crafted payloads.
+    _nonblank: Allocation-free check that a string has substantive content.
 """
 
-from typing import Any
+from typing import Any, Optional
 
 # ═══════════════════════════════════════════════════════════════════════════
 # CONSTANTS
@@ -24,3 +25,65 @@ from typing import Any
 # Maximum allowed nesting depth for JSON-like structures.
 MAX_NESTING_DEPTH = 20
 MAX_CHUNK_SIZE = 10_000_000  # 10 MB
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# VALIDATION FUNCTIONS
+# ═══════════════════════════════════════════════════════════════════════════
+
+def _nonblank(value: Optional[str]) -> bool:
+    """Checks that a string holds at least one non-whitespace character.
+
+    Allocation-free equivalent of ``bool(value and value.strip())``:
+    str.isspace scans in C without materializing the stripped copy, which
+    matters in the per-message substance validators on the streaming hot path.
+
+    Args:
+        value: The string to test (None is treated as blank).
+
+    Returns:
+        True if the value contains substantive (non-whitespace) content.
+    """
+    return bool(value) and not value.isspace()
+
+
+def _validate_recursion_depth(
+    data: Any,
+    max_depth: int = MAX_NESTING_DEPTH,
+    current_depth: int = 0
+) -> None:
+    """Validates that a JSON-like structure does not exceed the nesting limit.
+
+    Walks every branch of the structure (dict values and list items) and
+    raises as soon as any branch crosses the limit. Protects against
+    maliciously crafted payloads (JSON bombs) that could trigger stack
+    overflow or memory exhaustion in downstream parsers. The walk uses an
+    explicit stack instead of recursion, so the validator itself never
+    consumes interpreter stack frames proportional to the nesting it is
+    defending against, and near-limit inputs cannot raise RecursionError.
+
+    Args:
+        data: The structure to validate (dict, list, or scalar).
+        max_depth: Maximum allowed nesting depth (default: MAX_NESTING_DEPTH).
+        current_depth: Depth the walk starts counting from. Do not pass explicitly.
+
+    Raises:
+        ValueError: If any branch exceeds the maximum nesting depth.
+    """
+    stack: list[tuple[Any, int]] = [(data, current_depth)]
+    while stack:
+        node, depth = stack.pop()
+        if depth > max_depth:
+            raise ValueError(
+                f"Data structure exceeds maximum nesting depth of {max_depth}. "
+                f"Payload may be malicious (JSON bomb) or corrupted."
+            )
+
+        if isinstance(node, dict):
+            child_depth = depth + 1
+            for value in node.values():
+                stack.append((value, child_depth))
+        elif isinstance(node, list):
+            child_depth = depth + 1
+            for item in node:
+                stack.append((item, child_depth))
@@ -111,14 +111,15 @@ class AppDiscoveryEngine:
 
     def _collect_blueprint_files(self, app_root: Path) -> list[Path]:
         patterns = ["*.xul.yml", "*.xul.yaml", "*.yml", "*.yaml"]
-        files: list[Path] = []
+        # A set guards against duplicates: 'main.xul.yml' matches both
+        # '*.xul.yml' and '*.yml'.
+        seen: set[Path] = set()
         for pattern in patterns:
             for file_path in app_root.rglob(pattern):
                 if "tools" in file_path.parts:
                     continue
-                files.append(file_path)
-        files.sort()
-        return files
+                seen.add(file_path)
+        return sorted(seen)
 
     def _collect_tool_files(self, tools_root: Path) -> list[Path]:
         if not tools_root.exists() or not tools_root.is_dir():
@@ -25,7 +25,8 @@ def mock_settings() -> Settings:
         Settings: Test configuration with development environment, test credentials,
             and file-based secret loading disabled.
     """
-    return Settings(
+    # from_env skips the .env parse entirely — see Settings.from_env.
+    return Settings.from_env(
         ENVIRONMENT="development",
         LOG_LEVEL="debug",
         SECRET_KEY="test_secret_key_for_unit_tests",
@@ -35,7 +36,6 @@ def mock_settings() -> Settings:
         # Provide test credentials to satisfy Pydantic validators
         POSTGRES_PASSWORD="test_pg_pass",
         REDIS_PASSWORD="test_redis_pass",
-        _env_file=None  # Bypass production environment file
     )
 
 @pytest.fixture(scope="function")
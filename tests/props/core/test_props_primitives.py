@@ -496,7 +496,12 @@ class TestMimeTypeProps:
         
         # Mix case to test normalization
         mixed_case = raw_input.upper() if len(raw_input) % 2 == 0 else raw_input.title()
-        
+
+        # Skip characters whose case mapping does not round-trip
+        # (e.g. 'ı'.upper() == 'I', which lowercases to 'i', not 'ı').
+        if not unicode_semantic_eq(mixed_case, raw_input):
+            return
+
         class MimeRecord(CanonicalRecord):
             mt: MimeType
             
@@ -3,22 +3,35 @@ Middleware test suite for request ID handling.
 
 Tests verify that the middleware correctly generates or preserves
 X-Request-ID headers for distributed tracing and request correlation.
+
+Health-probe paths are exempt from correlation (they are scrape traffic,
+not business traffic), so correlation behavior is exercised against a
+test-only echo route registered on the application.
 """
 import uuid
 from fastapi.testclient import TestClient
 
+from xulcan.main import app
+
+_ECHO_PATH = "/_test/echo"
+
+if not any(getattr(route, "path", None) == _ECHO_PATH for route in app.routes):
+    @app.get(_ECHO_PATH, include_in_schema=False)
+    async def _echo() -> dict[str, str]:
+        return {"status": "ok"}
+
 
 def test_request_id_generation(client: TestClient):
     """Verify middleware generates a valid UUID when X-Request-ID is not provided.
-    
+
     Args:
         client: FastAPI test client fixture.
     """
-    response = client.get("/health/live")
-    
+    response = client.get(_ECHO_PATH)
+
     assert response.status_code == 200
     req_id = response.headers.get("X-Request-ID")
-    
+
     # Validate header exists and contains a valid UUID
     assert req_id is not None
     assert uuid.UUID(req_id)
@@ -26,17 +39,32 @@ def test_request_id_generation(client: TestClient):
 
 def test_request_id_passthrough(client: TestClient):
     """Verify middleware preserves client-provided X-Request-ID headers.
-    
+
     This ensures compatibility with upstream load balancers and API gateways
     that inject their own request identifiers.
-    
+
     Args:
         client: FastAPI test client fixture.
     """
     custom_trace_id = "trace-abc-123"
     response = client.get(
-        "/health/live", 
+        _ECHO_PATH,
         headers={"X-Request-ID": custom_trace_id}
     )
-    
-    assert response.headers.get("X-Request-ID") == custom_trace_id
\ No newline at end of file
+
+    assert response.headers.get("X-Request-ID") == custom_trace_id
+
+
+def test_health_probes_bypass_correlation(client: TestClient):
+    """Verify health-probe paths skip the correlation middleware entirely.
+
+    Probe traffic is scraped every few seconds per pod and carries no
+    business logic; it must not pay for ID generation or header injection.
+
+    Args:
+        client: FastAPI test client fixture.
+    """
+    response = client.get("/health/live")
+
+    assert response.status_code == 200
+    assert response.headers.get("X-Request-ID") is None
@@ -11,8 +11,12 @@ import warnings
 
 from xulcan.core import (
     UsageStats,
+    UsageAccumulator,
     BudgetStrategy,
-    BudgetConfig
+    BudgetConfig,
+    parse_usage_json,
+    parse_usage_list_json,
+    sum_usage
 )
 
 
@@ -220,6 +224,86 @@ class TestCalculatedProperties:
         assert stats.total_cache_tokens == 50
 
 
+class TestJsonParsing:
+    """Single-pass JSON parse + validate helpers."""
+
+    def test_parse_usage_json_roundtrip(self, valid_usage_stats: UsageStats) -> None:
+        """Should reconstruct a record from its JSON serialization."""
+        parsed = parse_usage_json(valid_usage_stats.model_dump_json())
+        assert parsed == valid_usage_stats
+
+    def test_parse_usage_json_rejects_invalid_math(self) -> None:
+        """Should enforce the usage invariants during parsing."""
+        with pytest.raises(ValidationError):
+            parse_usage_json(
+                '{"input_tokens": 1, "output_tokens": 1, '
+                '"total_tokens": 999, "latency_ms": 1.0}'
+            )
+
+    def test_parse_usage_list_json(self, valid_usage_stats: UsageStats) -> None:
+        """Should validate every entry of a JSON array."""
+        payload = f"[{valid_usage_stats.model_dump_json()}]"
+        assert parse_usage_list_json(payload) == [valid_usage_stats]
+
+
+class TestUsageAccumulator:
+    """In-place accumulation for reduction loops."""
+
+    def test_accumulates_and_freezes(self, valid_usage_stats: UsageStats) -> None:
+        """Should match the equivalent chain of __add__ calls."""
+        acc = UsageAccumulator()
+        acc.add(valid_usage_stats).add(valid_usage_stats)
+
+        assert acc.freeze() == valid_usage_stats + valid_usage_stats
+
+    def test_empty_accumulator_freezes_to_zero(self) -> None:
+        """Should snapshot to the additive identity when nothing was added."""
+        assert UsageAccumulator().freeze() == UsageStats.zero()
+
+
+class TestSumUsage:
+    """Single-pass bulk aggregation."""
+
+    def test_sum_usage_matches_pairwise_addition(self, valid_usage_stats: UsageStats) -> None:
+        """Should equal the equivalent reduction with __add__."""
+        records = [valid_usage_stats] * 3
+        assert sum_usage(records) == sum(records, UsageStats.zero())
+
+    def test_sum_usage_of_empty_iterable_is_zero(self) -> None:
+        """Should return the zero singleton without allocating."""
+        assert sum_usage([]) is UsageStats.zero()
+
+
+class TestTrustedConstruction:
+    """Validation-free construction for adapter-internal paths."""
+
+    def test_from_trusted_builds_equivalent_instance(self) -> None:
+        """Should produce the same values as the validated constructor."""
+        trusted = UsageStats.from_trusted(
+            input_tokens=100,
+            output_tokens=50,
+            total_tokens=150,
+            latency_ms=1200.0
+        )
+        validated = UsageStats(
+            input_tokens=100,
+            output_tokens=50,
+            total_tokens=150,
+            latency_ms=1200.0
+        )
+        assert trusted == validated
+
+    def test_from_trusted_skips_validators(self) -> None:
+        """Should not run invariant checks on pre-validated data."""
+        stats = UsageStats.from_trusted(
+            input_tokens=1,
+            output_tokens=1,
+            total_tokens=999,  # Would fail token math under validation
+            latency_ms=1.0
+        )
+        assert stats.total_tokens == 999
+
+
 class TestArithmetic:
     """Object addition behavior."""
 
@@ -271,12 +355,18 @@ class TestArithmeticIdentity:
         """Should return identical stats values when adding UsageStats.zero()."""
         zero = UsageStats.zero()
         result = valid_usage_stats + zero
-        
+
         # Values must match
         assert result == valid_usage_stats
-        
-        # But object reference must be new (Immutability check)
-        assert result is not valid_usage_stats
+
+        # Zero-addition short-circuits to the same frozen instance; aliasing
+        # is safe because UsageStats is immutable.
+        assert result is valid_usage_stats
+
+    def test_zero_plus_stats_returns_stats(self, valid_usage_stats: UsageStats) -> None:
+        """Should short-circuit symmetrically when the left operand is zero."""
+        result = UsageStats.zero() + valid_usage_stats
+        assert result is valid_usage_stats
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -396,6 +486,29 @@ class TestBoundednessDetection:
         assert budget.is_unbounded is False
 
 
+class TestEffectiveLimits:
+    """Branchless sentinel accessors for enforcement loops."""
+
+    def test_effective_limits_pass_through_when_defined(self) -> None:
+        """Should return the declared limits unchanged."""
+        budget = BudgetConfig(
+            token_limit=1000,
+            time_limit_ms=5000.0,
+            strategy=BudgetStrategy.HARD_CAP
+        )
+        assert budget.effective_token_limit == 1000
+        assert budget.effective_time_limit_ms == 5000.0
+
+    def test_effective_limits_map_none_to_sentinels(self) -> None:
+        """Should map unbounded limits to values no usage can exceed."""
+        import math
+        import sys
+
+        budget = BudgetConfig(strategy=BudgetStrategy.SOFT_NOTIFY)
+        assert budget.effective_token_limit == sys.maxsize
+        assert budget.effective_time_limit_ms == math.inf
+
+
 class TestEnumValues:
     """BudgetStrategy enumeration behavior."""
 
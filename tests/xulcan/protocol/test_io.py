@@ -18,6 +18,7 @@ from xulcan.protocol.io import (
     FunctionCallDelta,
     ToolCallDelta,
     DeltaContent,
+    DeltaAccumulator,
     UnifiedChunk,
 )
 from xulcan.protocol.tools import ToolCall
@@ -730,6 +731,45 @@ class TestEdgeCasesAndBoundaries:
             usage=valid_usage_stats
             # No finish_reason - not technically final
         )
-        
+
         assert chunk.usage is not None
-        assert chunk.finish_reason is None
\ No newline at end of file
+        assert chunk.finish_reason is None
+
+
+class TestDeltaAccumulator:
+    """Validates stream reconstruction via the DeltaAccumulator helper."""
+
+    def test_accumulates_all_string_channels(self) -> None:
+        """Should join fragments per channel in arrival order."""
+        acc = DeltaAccumulator()
+        acc.add(DeltaContent(content="Hel", reasoning_content="think"))
+        acc.add(DeltaContent(content="lo", refusal="no"))
+        acc.add(DeltaContent(reasoning_content="ing", refusal="pe"))
+
+        assert acc.content == "Hello"
+        assert acc.reasoning_content == "thinking"
+        assert acc.refusal == "nope"
+
+    def test_untouched_channels_are_none(self) -> None:
+        """Channels that never received a fragment should stay None."""
+        acc = DeltaAccumulator()
+        acc.add(DeltaContent(content="only text"))
+
+        assert acc.content == "only text"
+        assert acc.reasoning_content is None
+        assert acc.refusal is None
+
+    def test_empty_fragments_are_preserved(self) -> None:
+        """Empty strings are valid fragments and mark the channel as present."""
+        acc = DeltaAccumulator()
+        acc.add(DeltaContent(content=""))
+
+        assert acc.content == ""
+
+    def test_add_returns_self_for_folding(self) -> None:
+        """add() should chain, mirroring UsageAccumulator's fold style."""
+        acc = DeltaAccumulator()
+        result = acc.add(DeltaContent(content="a")).add(DeltaContent(content="b"))
+
+        assert result is acc
+        assert acc.content == "ab"
\ No newline at end of file
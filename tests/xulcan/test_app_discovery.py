@@ -27,7 +27,7 @@ def test_manifest_accepts_apps_list() -> None:
         "apps": ["apps/chat", "apps/quotations"],
     })
 
-    assert manifest.apps == ["apps/chat", "apps/quotations"]
+    assert [app.path for app in manifest.apps] == ["apps/chat", "apps/quotations"]
 
 
 def make_blueprint_yaml(name: str, system_prompt: str) -> str:
@@ -77,6 +77,8 @@ def test_app_discovery_registers_app_namespace_and_tools(tmp_path: Path) -> None
                   gemini:
                     driver: gemini
                     model: test
+                    params:
+                      api_key: test-key
             blueprints:
               paths: []
               autoload: false
@@ -119,6 +121,8 @@ def test_app_folder_without_agents_or_tools_raises(tmp_path: Path) -> None:
                   gemini:
                     driver: gemini
                     model: test
+                    params:
+                      api_key: test-key
             blueprints:
               paths: []
               autoload: false
@@ -161,6 +165,8 @@ def test_tool_name_collision_is_namespaced(tmp_path: Path) -> None:
                   gemini:
                     driver: gemini
                     model: test
+                    params:
+                      api_key: test-key
             blueprints:
               paths: []
               autoload: false